@@ -0,0 +1,82 @@
+"""Deterministic local services for benchmarks."""
+
+import functools
+import time
+from os import PathLike
+from pathlib import Path
+
+from manim_speech import cache, services
+
+# An MPEG-1 Layer III frame (128 kbps, 44.1 kHz, 1152 samples) of digital silence.
+MP3_FRAME = b"\xff\xfb\x90\x64" + b"\x00" * 413
+MP3_FRAME_DURATION = 1152 / 44100
+
+
+@functools.cache
+def silent_mp3(duration: float) -> bytes:
+    return MP3_FRAME * max(1, round(duration / MP3_FRAME_DURATION))
+
+
+def fake_transcript(text: str, word_duration: float) -> services.Transcript:
+    boundaries: list[services.Boundary] = []
+    offset = 0
+    for i, word in enumerate(text.split()):
+        offset = text.index(word, offset)
+        boundaries.append(
+            services.Boundary(text=word, start=i * word_duration, end=(i + 1) * word_duration, text_start=offset)
+        )
+        offset += len(word)
+    return services.Transcript(text=text, boundaries=boundaries)
+
+
+class FakeTTSService(services.TTSService):
+    fingerprint_attrs = ("word_duration", "timestamps")
+
+    def __init__(self, *, latency: float = 0.0, word_duration: float = 0.3, timestamps: bool = False) -> None:
+        self.latency = latency
+        self.word_duration = word_duration
+        self.timestamps = timestamps
+
+    @property
+    def service_name(self) -> str:
+        return "Fake"
+
+    def tts(self, text: str, out_path: str | PathLike[str]) -> services.Transcript | None:
+        time.sleep(self.latency)
+        Path(out_path).write_bytes(silent_mp3(len(text.split()) * self.word_duration))
+        return fake_transcript(text, self.word_duration) if self.timestamps else None
+
+
+class FakeSTTService(services.STTService):
+    # The audio is silent, so the words are read back from the metadata of the cache entry it belongs to.
+    fingerprint_attrs = ("word_duration",)
+
+    def __init__(self, *, latency: float = 0.0, word_duration: float = 0.3) -> None:
+        self.latency = latency
+        self.word_duration = word_duration
+
+    @property
+    def service_name(self) -> str:
+        return "Fake"
+
+    def stt(self, in_path: str | PathLike[str]) -> services.Transcript:
+        time.sleep(self.latency)
+        metadata = cache.read_metadata(Path(in_path).parent)
+        return fake_transcript(metadata.text if metadata is not None else "", self.word_duration)
+
+
+class FakeTranslationService(services.TranslationService):
+    def __init__(self, *, latency: float = 0.0) -> None:
+        self.latency = latency
+
+    @property
+    def service_name(self) -> str:
+        return "Fake"
+
+    def translate(self, text: str, src_lang: str, dst_lang: str) -> str:
+        time.sleep(self.latency)
+        return f"[{dst_lang}] {text}"
+
+    def translate_batch(self, texts: list[str], src_lang: str, dst_lang: str) -> list[str]:
+        time.sleep(self.latency)
+        return [f"[{dst_lang}] {text}" for text in texts]
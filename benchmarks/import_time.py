@@ -0,0 +1,109 @@
+"""Import time benchmark for Manim Speech.
+
+Imports each target in fresh interpreters and reports the median import time. Exits with an error if an optional
+dependency is loaded eagerly, or if an import is slower than the saved baseline by more than the tolerance.
+
+    python benchmarks/import_time.py            # compare against benchmarks/import_time.json
+    python benchmarks/import_time.py --update   # save the current times as the baseline
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections import abc
+from pathlib import Path
+
+BASELINE_PATH = Path(__file__).with_name("import_time.json")
+
+# Statements run in a fresh interpreter each, timed from after the interpreter has started.
+TARGETS = {
+    "package": "import manim_speech",
+    "services": "import manim_speech.services",
+    "voiceover": "import manim_speech.voiceover",
+    "translation": "import manim_speech.translation",
+    "scene": "from manim_speech import VoiceoverScene",
+}
+
+# Modules that must only be loaded when the feature using them is.
+LAZY_MODULES = [
+    "av",
+    "mutagen",
+    "polib",
+    "httpx",
+    "manim_speech.services.ratelimit",
+    "openai",
+    "elevenlabs",
+    "deepl",
+    "assemblyai",
+    "whisper",
+    "torch",
+    "faster_whisper",
+    "piper",
+    "boto3",
+]
+
+# Modules that only scenes need, so they must not be loaded by the other targets.
+SCENE_MODULES = ["manim", "numpy"]
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+exec(sys.argv[1])
+print(json.dumps({"elapsed": time.perf_counter() - start, "modules": list(sys.modules)}))
+"""
+
+
+def measure(statement: str) -> tuple[float, set[str]]:
+    # `-X importtime` does not see modules loaded through `importlib`, as lazy attributes are, so the wall time is used.
+    result = subprocess.run([sys.executable, "-c", SCRIPT, statement], capture_output=True, text=True, check=True)
+    data = json.loads(result.stdout)
+    return data["elapsed"] * 1000, set(data["modules"])
+
+
+def run(repeat: int) -> tuple[dict[str, float], dict[str, list[str]]]:
+    medians: dict[str, float] = {}
+    eager: dict[str, list[str]] = {}
+    for name, statement in TARGETS.items():
+        times: list[float] = []
+        for _ in range(repeat):
+            elapsed, modules = measure(statement)
+            times.append(elapsed)
+        medians[name] = statistics.median(times)
+        lazy_modules = LAZY_MODULES if name == "scene" else [*SCENE_MODULES, *LAZY_MODULES]
+        eager[name] = [lazy for lazy in lazy_modules if lazy in modules]
+    return medians, eager
+
+
+def main(argv: abc.Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the import time of Manim Speech.")
+    parser.add_argument("-n", "--repeat", type=int, default=10, help="Number of interpreters to start per target.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown relative to the baseline.")
+    parser.add_argument("--update", action="store_true", help="Save the measured times as the new baseline.")
+    args = parser.parse_args(argv)
+
+    medians, eager = run(args.repeat)
+    baseline: dict[str, float] = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    failed = False
+    for name, median in medians.items():
+        line = f"{name:<12} {median:8.1f} ms"
+        if name in baseline:
+            line += f"  (baseline {baseline[name]:.1f} ms, {median / baseline[name] - 1:+.0%})"
+            if median > baseline[name] * (1 + args.tolerance):
+                line += "  REGRESSION"
+                failed = True
+        if eager[name]:
+            line += f"  eagerly imports {', '.join(eager[name])}"
+            failed = True
+        print(line)
+
+    if args.update:
+        BASELINE_PATH.write_text(json.dumps(medians, indent=4) + "\n")
+        print(f"Saved baseline to {BASELINE_PATH}.")
+        return 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""Voiceover and translation pipeline benchmarks for Manim Speech.
+
+Runs the pipelines on scenes of increasing size with the fake services in `fakes.py`, so no network access or API keys
+are needed, and reports throughput and latency percentiles. Exits with an error if a result is slower than the saved
+baseline by more than the tolerance.
+
+    python benchmarks/pipeline.py                          # compare against benchmarks/pipeline.json
+    python benchmarks/pipeline.py --sizes 10 100 --update  # save the current results as the baseline
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import abc
+from pathlib import Path
+
+import manim
+import numpy as np
+import polib
+from fakes import FakeSTTService, FakeTranslationService, FakeTTSService, fake_transcript
+
+from manim_speech import backends, services, translation, voiceover
+
+BASELINE_PATH = Path(__file__).with_name("pipeline.json")
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+WORDS_PER_BOOKMARK = 10
+
+
+class Result:
+    def __init__(self, latencies: list[float], elapsed: float, ops: int) -> None:
+        self.latencies = latencies
+        self.elapsed = elapsed
+        self.ops = ops
+
+    def to_dict(self) -> dict[str, float]:
+        result = {"throughput": self.ops / self.elapsed}
+        if self.latencies:
+            p50, p90, p99 = np.percentile(np.array(self.latencies) * 1000, [50, 90, 99])
+            result.update(p50=float(p50), p90=float(p90), p99=float(p99))
+        return result
+
+
+def make_texts(n: int) -> list[str]:
+    return [
+        f"Clip number {i} shows the quick brown fox. <bookmark mark='fox'/>It jumps over the lazy dog {i % 7} times."
+        for i in range(n)
+    ]
+
+
+def timed(func: abc.Callable[[str], object], items: abc.Sequence[str]) -> Result:
+    latencies: list[float] = []
+    start = time.perf_counter()
+    for item in items:
+        op_start = time.perf_counter()
+        func(item)
+        latencies.append(time.perf_counter() - op_start)
+    return Result(latencies, time.perf_counter() - start, len(items))
+
+
+def bench_voiceover(n: int, latency: float, cache_dir: Path) -> dict[str, Result]:
+    tts, stt = FakeTTSService(latency=latency), FakeSTTService(latency=latency)
+    backend = backends.LocalCacheBackend()
+    texts = make_texts(n)
+    results: dict[str, Result] = {}
+
+    def create(text: str) -> voiceover.VoiceoverData:
+        return voiceover.create(text, tts, stt, cache_dir=cache_dir / "create", backend=backend)
+
+    results["create_miss"] = timed(create, texts)
+    results["create_hit"] = timed(create, texts)
+
+    manifest = voiceover.Manifest(cache_dir / "create" / "manifest-benchmark.json")
+    for text in texts:
+        manifest.add(text, tts, stt, create(text))
+    manifest.save()
+    manifest = voiceover.Manifest(manifest.path)
+    results["manifest_hit"] = timed(lambda text: manifest.get(text, tts, stt), texts)
+
+    start = time.perf_counter()
+    voiceover.prefetch(texts, tts, stt, cache_dir=cache_dir / "prefetch", backend=backend)
+    results["prefetch_miss"] = Result([], time.perf_counter() - start, n)
+    return results
+
+
+def bench_bookmarks(n: int) -> dict[str, Result]:
+    # One bookmark every few words of a transcript with `n` bookmarks, as in a long voiceover.
+    words = [f"word{i}" for i in range(n * WORDS_PER_BOOKMARK)]
+    text = " ".join(
+        f"<bookmark mark='b{i // WORDS_PER_BOOKMARK}'/>{word}" if i % WORDS_PER_BOOKMARK == 0 else word
+        for i, word in enumerate(words)
+    )
+    transcript = services.TranscriptView.from_transcript(fake_transcript(" ".join(words), 0.3))
+    return {"bookmark_times": timed(lambda text: voiceover.get_bookmark_times(text, transcript), [text] * 5)}
+
+
+def bench_translation(n: int, latency: float, work_dir: Path) -> dict[str, Result]:
+    # `translate_po_file` works on `locales` in the current directory.
+    pot = polib.POFile()
+    pot.extend(polib.POEntry(msgid=text) for text in make_texts(n))
+    (work_dir / "locales").mkdir()
+    pot.save(str(work_dir / "locales" / "benchmark.pot"))
+    service = FakeTranslationService(latency=latency)
+    memory = translation.TranslationMemory(work_dir / "memory.sqlite3")
+    results: dict[str, Result] = {}
+    cwd = Path.cwd()
+    os.chdir(work_dir)
+    try:
+        for name, language in [("translate_miss", "de"), ("translate_memory_hit", "fr")]:
+            if name == "translate_memory_hit":
+                # As if translated for another domain before, so every message is found in the translation memory.
+                memory.insert({text: f"[fr] {text}" for text in make_texts(n)}, "en", "fr", service.fingerprint)
+            start = time.perf_counter()
+            translation.translate_po_file("benchmark", "en", language, service=service, memory=memory)
+            results[name] = Result([], time.perf_counter() - start, n)
+    finally:
+        os.chdir(cwd)
+    return results
+
+
+def run(sizes: abc.Sequence[int], latency: float) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as voiceover_dir, tempfile.TemporaryDirectory() as translation_dir:
+            for name, result in {
+                **bench_voiceover(n, latency, Path(voiceover_dir)),
+                **bench_bookmarks(n),
+                **bench_translation(n, latency, Path(translation_dir)),
+            }.items():
+                results[f"{name}/{n}"] = result.to_dict()
+                print(format_result(f"{name}/{n}", results[f"{name}/{n}"]), flush=True)
+    return results
+
+
+def format_result(name: str, result: dict[str, float]) -> str:
+    line = f"{name:<28} {result['throughput']:12.1f} ops/s"
+    if "p50" in result:
+        line += f"  p50 {result['p50']:9.3f} ms  p90 {result['p90']:9.3f} ms  p99 {result['p99']:9.3f} ms"
+    return line
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], tolerance: float) -> list[str]:
+    regressions: list[str] = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        if result["throughput"] < base["throughput"] / (1 + tolerance):
+            regressions.append(f"{name}: {result['throughput']:.1f} ops/s, baseline {base['throughput']:.1f} ops/s")
+        if "p90" in result and "p90" in base and result["p90"] > base["p90"] * (1 + tolerance):
+            regressions.append(f"{name}: p90 {result['p90']:.3f} ms, baseline {base['p90']:.3f} ms")
+    return regressions
+
+
+def main(argv: abc.Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the voiceover and translation pipelines.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Numbers of clips per scene.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated latency of each service call (s).")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown relative to the baseline.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline results file.")
+    parser.add_argument("--update", action="store_true", help="Save the results as the new baseline.")
+    args = parser.parse_args(argv)
+
+    manim.logger.setLevel("WARNING")
+    results = run(args.sizes, args.latency)
+
+    if args.update:
+        baseline: dict[str, dict[str, float]] = {}
+        with contextlib.suppress(OSError, ValueError):
+            baseline = json.loads(args.baseline.read_text())
+        args.baseline.write_text(json.dumps({**baseline, **results}, indent=4, sort_keys=True) + "\n")
+        print(f"Saved baseline to {args.baseline}.")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}. Run with --update to save one.")
+        return 0
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
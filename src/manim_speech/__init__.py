@@ -1,6 +1,31 @@
 """Manim plugin for adding speech to videos."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from . import services
-from .scene import TranslationScene, VoiceoverScene
 
-__all__ = ["TranslationScene", "VoiceoverScene", "services"]
+if TYPE_CHECKING:
+    from .scene import TranslatedVoiceoverScene, TranslationScene, VoiceoverScene
+
+# Scenes import Manim, which render workers that only load cached voiceovers may not need yet (PEP 562).
+_LAZY_ATTRS = {
+    "TranslatedVoiceoverScene": "scene",
+    "TranslationScene": "scene",
+    "VoiceoverScene": "scene",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRS})
+
+
+__all__ = ["TranslatedVoiceoverScene", "TranslationScene", "VoiceoverScene", "services"]
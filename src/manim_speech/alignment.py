@@ -0,0 +1,163 @@
+"""Word alignment between voiceover scripts and transcripts."""
+
+import re
+import unicodedata
+
+import numpy as np
+
+from . import services
+
+# Scripts without spaces between words (Chinese, Japanese, Korean) are tokenized per character.
+TOKEN_PATTERN = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]|[^\W_]+")
+
+RESYNC_WINDOW = 64
+RESYNC_RUN = 3
+MAX_CELLS = 1 << 18
+
+_DIAGONAL, _UP, _LEFT = 0, 1, 2
+
+
+class Alignment:
+    def __init__(self, offsets: np.ndarray, times: np.ndarray, token_offsets: np.ndarray, score: float) -> None:
+        # Script offsets and transcript times of the matched tokens, and the offsets of all script tokens.
+        self.offsets = offsets
+        self.times = times
+        self.token_offsets = token_offsets
+        self.score = score
+
+    def get_times(self, offsets: np.ndarray, text_len: int, end: float) -> np.ndarray:
+        # Offsets are snapped to the next script token, so a bookmark placed before a word fires when it is spoken.
+        indices = np.searchsorted(self.token_offsets, offsets)
+        snapped = np.append(self.token_offsets, text_len)[indices]
+        return np.interp(snapped, np.append(self.offsets, text_len), np.append(self.times, end))
+
+
+def _normalize(token: str) -> str:
+    return unicodedata.normalize("NFKC", token).casefold()
+
+
+def _tokenize(text: str) -> tuple[list[str], list[int]]:
+    tokens: list[str] = []
+    offsets: list[int] = []
+    for match in TOKEN_PATTERN.finditer(text):
+        tokens.append(_normalize(match.group()))
+        offsets.append(match.start())
+    return tokens, offsets
+
+
+def _tokenize_transcript(transcript: services.TranscriptView) -> tuple[list[str], list[float]]:
+    tokens: list[str] = []
+    times: list[float] = []
+    for word, start, end in zip(transcript.words.tolist(), transcript.starts.tolist(), transcript.ends.tolist()):
+        word_tokens = [_normalize(token) for token in TOKEN_PATTERN.findall(word)]
+        tokens.extend(word_tokens)
+        # Words containing several tokens (e.g. "don't" or a run of characters) are split evenly.
+        times.extend(start + (end - start) * k / len(word_tokens) for k in range(len(word_tokens)))
+    return tokens, times
+
+
+def _banded_alignment(a: list[str], b: list[str], band: int) -> tuple[int, list[tuple[int, int]]]:
+    # Edit distance restricted to |i - j| <= band. The result is only optimal if the distance is within the band.
+    n, m = len(a), len(b)
+    inf = n + m + 1
+    prev_lo, prev = 0, list(range(min(m, band) + 1))
+    pointers = [bytearray([_LEFT]) * len(prev)]
+    for i in range(1, n + 1):
+        lo, hi = max(0, i - band), min(m, i + band)
+        prev_hi = prev_lo + len(prev) - 1
+        row = [inf] * (hi - lo + 1)
+        row_pointers = bytearray(hi - lo + 1)
+        token = a[i - 1]
+        for j in range(lo, hi + 1):
+            best, pointer = inf, _UP
+            if j <= prev_hi:
+                best = prev[j - prev_lo] + 1
+            if j > lo and row[j - 1 - lo] + 1 < best:
+                best, pointer = row[j - 1 - lo] + 1, _LEFT
+            if j > 0 and prev_lo <= j - 1 <= prev_hi:
+                diagonal = prev[j - 1 - prev_lo] + (token != b[j - 1])
+                if diagonal <= best:
+                    best, pointer = diagonal, _DIAGONAL
+            row[j - lo] = best
+            row_pointers[j - lo] = pointer
+        pointers.append(row_pointers)
+        prev_lo, prev = lo, row
+
+    pairs: list[tuple[int, int]] = []
+    i, j = n, m
+    while i > 0 or j > 0:
+        pointer = pointers[i][j - max(0, i - band)] if i > 0 else _LEFT
+        if pointer == _DIAGONAL:
+            if a[i - 1] == b[j - 1]:
+                pairs.append((i - 1, j - 1))
+            i, j = i - 1, j - 1
+        elif pointer == _UP:
+            i -= 1
+        else:
+            j -= 1
+    pairs.reverse()
+    return prev[m - prev_lo], pairs
+
+
+def _edit_alignment(a: list[str], b: list[str]) -> list[tuple[int, int]]:
+    max_band = MAX_CELLS // (2 * len(a) + 1)
+    if not a or not b or abs(len(a) - len(b)) > max_band:
+        return []
+    band = min(abs(len(a) - len(b)) + 8, max_band)
+    while True:
+        distance, pairs = _banded_alignment(a, b, band)
+        # Past the maximum band the path may not be optimal, but it is still a valid alignment.
+        if distance <= band or band >= max_band:
+            return pairs
+        band = min(band * 2, max_band)
+
+
+def _find_resync(a: list[str], b: list[str], i: int, j: int, window: int) -> tuple[int, int] | None:
+    # Finds the nearest (di, dj) after a mismatch where both sequences agree again for a run of tokens.
+    positions: dict[str, list[int]] = {}
+    for dj, token in enumerate(b[j : j + window]):
+        positions.setdefault(token, []).append(dj)
+
+    best: tuple[int, int] | None = None
+    for di, token in enumerate(a[i : i + window]):
+        if best is not None and di >= sum(best):
+            break
+        for dj in positions.get(token, ()):
+            if (best is None or di + dj < sum(best)) and (
+                a[i + di : i + di + RESYNC_RUN] == b[j + dj : j + dj + RESYNC_RUN]
+            ):
+                best = (di, dj)
+    return best
+
+
+def align_tokens(a: list[str], b: list[str]) -> list[tuple[int, int]]:
+    # Matching runs are walked in O(n), and edit distance is only computed over the mismatched regions between them.
+    pairs: list[tuple[int, int]] = []
+    i, j = 0, 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            pairs.append((i, j))
+            i, j = i + 1, j + 1
+            continue
+        window = RESYNC_WINDOW
+        while (resync := _find_resync(a, b, i, j, window)) is None and (i + window < len(a) or j + window < len(b)):
+            window *= 4
+        if resync is None:
+            pairs.extend((i + p, j + q) for p, q in _edit_alignment(a[i:], b[j:]))
+            break
+        di, dj = resync
+        pairs.extend((i + p, j + q) for p, q in _edit_alignment(a[i : i + di], b[j : j + dj]))
+        i, j = i + di, j + dj
+    return pairs
+
+
+def align(text: str, transcript: services.TranscriptView) -> Alignment:
+    script_tokens, script_offsets = _tokenize(text)
+    transcript_tokens, transcript_times = _tokenize_transcript(transcript)
+    pairs = align_tokens(script_tokens, transcript_tokens)
+    return Alignment(
+        np.array([script_offsets[i] for i, _ in pairs], dtype=np.int64),
+        np.array([transcript_times[j] for _, j in pairs], dtype=np.float64),
+        np.array(script_offsets, dtype=np.int64),
+        len(pairs) / len(script_tokens) if script_tokens else 1.0,
+    )
@@ -0,0 +1,193 @@
+"""Audio utils for Manim Speech."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import wave
+from os import PathLike
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+
+# numpy is imported by the functions processing samples, so loading cached voiceovers does not load it.
+if TYPE_CHECKING:
+    import numpy as np
+
+# ITU-R BS.1770 gating: 400 ms blocks overlapping by 75%, an absolute gate and a gate relative to the mean loudness.
+LOUDNESS_BLOCK = 0.4
+LOUDNESS_STEP = 0.1
+ABSOLUTE_GATE = -70.0
+RELATIVE_GATE = -10.0
+SILENCE_FRAME = 0.01
+
+
+class PostProcessing(BaseModel):
+    trim_silence: bool = True
+    silence_threshold: float = -50.0
+    silence_padding: float = 0.05
+    loudness: float | None = -16.0
+    peak: float = -1.0
+
+    @property
+    def fingerprint(self) -> str:
+        return hashlib.sha256(self.model_dump_json().encode()).hexdigest()
+
+
+def write_mp3(path: str | PathLike[str], samples: np.ndarray, sample_rate: int) -> None:
+    # PyAV is imported on first use, so loading cached voiceovers does not pay for loading FFmpeg.
+    import av
+    import numpy as np
+
+    with av.open(os.fspath(path), "w", format="mp3") as container:
+        stream = container.add_stream("libmp3lame", rate=sample_rate, layout="mono")
+        frame = av.AudioFrame.from_ndarray(samples.astype(np.float32).reshape(1, -1), format="fltp", layout="mono")
+        frame.sample_rate = sample_rate
+        for packet in stream.encode(frame):
+            container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+
+
+def read_audio(path: str | PathLike[str], sample_rate: int | None = None) -> tuple[np.ndarray, int]:
+    import av
+    import numpy as np
+
+    with av.open(os.fspath(path)) as container:
+        stream = container.streams.audio[0]
+        sample_rate = sample_rate or stream.rate
+        resampler = av.AudioResampler(format="fltp", layout="mono", rate=sample_rate)
+        chunks = [
+            resampled.to_ndarray()[0]
+            for frame in [*container.decode(stream), None]
+            for resampled in resampler.resample(frame)
+        ]
+    return (np.concatenate(chunks) if chunks else np.zeros(0, np.float32)), sample_rate
+
+
+def probe(path: str | PathLike[str]) -> tuple[float, int, str]:
+    import av
+    from mutagen import File
+
+    # mutagen reads the duration from the headers (the Xing/VBRI header for VBR MP3s) instead of decoding the file.
+    info = File(path).info
+    with av.open(os.fspath(path)) as container:
+        codec = container.streams.audio[0].codec_context.codec.canonical_name
+    return info.length, info.sample_rate, codec
+
+
+def write_wav(path: str | PathLike[str], samples: np.ndarray, sample_rate: int) -> None:
+    import numpy as np
+
+    with wave.open(os.fspath(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes((np.clip(samples, -1.0, 1.0) * 32767).astype("<i2").tobytes())
+
+
+def concatenate(in_paths: list[str | PathLike[str]], out_path: str | PathLike[str], gap: float = 0.0) -> list[float]:
+    # Clips are decoded and re-encoded as one stream, so there are no gaps or clicks between them, except for `gap`
+    # seconds of silence if requested. Returns the duration of each clip.
+    import numpy as np
+
+    parts: list[np.ndarray] = []
+    sample_rate: int | None = None
+    for in_path in in_paths:
+        samples, sample_rate = read_audio(in_path, sample_rate)
+        parts.append(samples)
+    assert sample_rate is not None
+    silence = np.zeros(round(gap * sample_rate), np.float32)
+    write_mp3(out_path, np.concatenate([part for samples in parts for part in (silence, samples)][1:]), sample_rate)
+    return [len(samples) / sample_rate for samples in parts]
+
+
+def _biquad_response(b: list[float], a: list[float], w: np.ndarray) -> np.ndarray:
+    import numpy as np
+
+    z = np.exp(-1j * w)
+    return (b[0] + b[1] * z + b[2] * z**2) / (a[0] + a[1] * z + a[2] * z**2)
+
+
+def _k_weighting_response(n: int, sample_rate: int) -> np.ndarray:
+    # BS.1770 pre-filter (high shelf) and RLB filter (high pass), derived for any sample rate as in pyloudnorm.
+    import numpy as np
+
+    w = 2 * np.pi * np.fft.rfftfreq(n)
+    k = np.tan(np.pi * 1681.974450955533 / sample_rate)
+    q = 0.7071752369554196
+    vh = 10 ** (3.999843853973347 / 20)
+    vb = vh**0.4996667741545416
+    a0 = 1 + k / q + k**2
+    shelf = _biquad_response(
+        [(vh + vb * k / q + k**2) / a0, 2 * (k**2 - vh) / a0, (vh - vb * k / q + k**2) / a0],
+        [1.0, 2 * (k**2 - 1) / a0, (1 - k / q + k**2) / a0],
+        w,
+    )
+    k = np.tan(np.pi * 38.13547087602444 / sample_rate)
+    q = 0.5003270373238773
+    a0 = 1 + k / q + k**2
+    high_pass = _biquad_response([1.0, -2.0, 1.0], [1.0, 2 * (k**2 - 1) / a0, (1 - k / q + k**2) / a0], w)
+    return shelf * high_pass
+
+
+def get_loudness(samples: np.ndarray, sample_rate: int) -> float:
+    # The filters are applied in the frequency domain, zero-padded so their impulse response does not wrap around.
+    import numpy as np
+
+    n = 1 << int(np.ceil(np.log2(len(samples) + sample_rate)))
+    filtered = np.fft.irfft(np.fft.rfft(samples, n) * _k_weighting_response(n, sample_rate), n)[: len(samples)]
+
+    block = int(LOUDNESS_BLOCK * sample_rate)
+    step = int(LOUDNESS_STEP * sample_rate)
+    if len(filtered) < block:
+        block = step = max(len(filtered), 1)
+    energy = np.concatenate([[0.0], np.cumsum(filtered.astype(np.float64) ** 2)])
+    starts = np.arange(0, len(filtered) - block + 1, step)
+    powers = (energy[starts + block] - energy[starts]) / block
+    with np.errstate(divide="ignore"):
+        loudness = -0.691 + 10 * np.log10(powers)
+    gated = powers[loudness > ABSOLUTE_GATE]
+    if not len(gated):
+        return -np.inf
+    threshold = -0.691 + 10 * np.log10(gated.mean()) + RELATIVE_GATE
+    gated = powers[loudness > max(threshold, ABSOLUTE_GATE)]
+    return float(-0.691 + 10 * np.log10(gated.mean()))
+
+
+def get_speech_bounds(samples: np.ndarray, sample_rate: int, threshold: float, padding: float) -> tuple[int, int]:
+    # Frames whose RMS level is above the threshold (in dBFS) are speech, and everything outside them is trimmed.
+    import numpy as np
+
+    frame = max(int(SILENCE_FRAME * sample_rate), 1)
+    n_frames = -(-len(samples) // frame)
+    frames = np.zeros(n_frames * frame, np.float32)
+    frames[: len(samples)] = samples
+    rms = np.sqrt(np.mean(frames.reshape(n_frames, frame) ** 2, axis=1))
+    speech = np.flatnonzero(rms > 10 ** (threshold / 20))
+    if not len(speech):
+        return 0, len(samples)
+    pad = int(padding * sample_rate)
+    return max(0, speech[0] * frame - pad), min(len(samples), (speech[-1] + 1) * frame + pad)
+
+
+def post_process(in_path: str | PathLike[str], out_path: str | PathLike[str], options: PostProcessing) -> float:
+    # Runs in a worker process. Returns the time trimmed from the start, which transcripts are shifted by.
+    import numpy as np
+
+    samples, sample_rate = read_audio(in_path)
+    start = 0
+    if options.trim_silence:
+        start, end = get_speech_bounds(samples, sample_rate, options.silence_threshold, options.silence_padding)
+        samples = samples[start:end]
+    if options.loudness is not None and len(samples):
+        loudness = get_loudness(samples, sample_rate)
+        if np.isfinite(loudness):
+            samples = samples * 10 ** ((options.loudness - loudness) / 20)
+    if len(samples):
+        # The whole clip is turned down rather than its peaks limited, so speech is not distorted.
+        peak = np.abs(samples).max()
+        if peak > 10 ** (options.peak / 20):
+            samples = samples * (10 ** (options.peak / 20) / peak)
+    write_mp3(out_path, samples, sample_rate)
+    return start / sample_rate
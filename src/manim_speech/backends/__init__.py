@@ -0,0 +1,5 @@
+"""Cache backends for Manim Speech."""
+
+from .base import CacheBackend, LocalCacheBackend
+
+__all__ = ["CacheBackend", "LocalCacheBackend"]
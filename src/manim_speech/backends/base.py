@@ -0,0 +1,29 @@
+"""Base classes for cache backends."""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+
+class CacheBackend(ABC):
+    poll_interval: float = 1.0
+    claim_timeout: float = 600.0
+
+    @abstractmethod
+    def get(self, key: str, name: str, out_path: Path) -> bool: ...
+
+    @abstractmethod
+    def put(self, key: str, name: str, in_path: Path) -> None: ...
+
+    def claim(self, key: str, name: str) -> bool:
+        return True
+
+    def release(self, key: str, name: str) -> None:
+        return None
+
+
+class LocalCacheBackend(CacheBackend):
+    def get(self, key: str, name: str, out_path: Path) -> bool:
+        return False
+
+    def put(self, key: str, name: str, in_path: Path) -> None:
+        return None
@@ -0,0 +1,155 @@
+"""HTTP object store cache backend."""
+
+import http.server
+import os
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+from os import PathLike
+from pathlib import Path
+
+from .base import CacheBackend
+
+
+class HTTPCacheBackend(CacheBackend):
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: float = 60.0,
+        poll_interval: float = 1.0,
+        claim_timeout: float = 600.0,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.claim_timeout = claim_timeout
+
+    def _request(
+        self, method: str, key: str, name: str, data: bytes | None = None, headers: dict[str, str] | None = None
+    ) -> tuple[int, bytes]:
+        request = urllib.request.Request(
+            f"{self.base_url}/{urllib.parse.quote(key)}/{urllib.parse.quote(name)}",
+            data=data,
+            headers={**self.headers, **(headers or {})},
+            method=method,
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+
+    def get(self, key: str, name: str, out_path: Path) -> bool:
+        status, body = self._request("GET", key, name)
+        if status == 404:
+            return False
+        if status != 200:
+            raise RuntimeError(f"GET {key}/{name} failed with status {status}")
+        tmp_path = out_path.with_name(f".{out_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, out_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return True
+
+    def put(self, key: str, name: str, in_path: Path) -> None:
+        status, _ = self._request("PUT", key, name, data=in_path.read_bytes())
+        if status not in (200, 201, 204):
+            raise RuntimeError(f"PUT {key}/{name} failed with status {status}")
+
+    def claim(self, key: str, name: str) -> bool:
+        for _ in range(2):
+            status, _ = self._request(
+                "PUT", key, f"{name}.lock", data=str(time.time()).encode(), headers={"If-None-Match": "*"}
+            )
+            if status in (200, 201, 204):
+                return True
+            if status != 412:
+                raise RuntimeError(f"PUT {key}/{name}.lock failed with status {status}")
+            status, body = self._request("GET", key, f"{name}.lock")
+            if status == 200:
+                try:
+                    claimed_at = float(body.decode())
+                except ValueError:
+                    # A lock that cannot be read (e.g. left empty by a crash) is treated as stale.
+                    claimed_at = 0.0
+                if time.time() - claimed_at <= self.claim_timeout:
+                    return False
+                self._request("DELETE", key, f"{name}.lock")
+        return False
+
+    def release(self, key: str, name: str) -> None:
+        self._request("DELETE", key, f"{name}.lock")
+
+
+class CacheRequestHandler(http.server.BaseHTTPRequestHandler):
+    root: Path
+
+    def _get_path(self) -> Path | None:
+        # Unquoted before splitting, so encoded separators (`..%2F`) cannot escape the root.
+        parts = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path).strip("/").split("/")
+        if len(parts) != 2 or any(part in ("", ".", "..") or "\\" in part for part in parts):
+            return None
+        path = self.root.joinpath(*parts)
+        if not path.resolve().is_relative_to(self.root.resolve()):
+            return None
+        return path
+
+    def _send(self, status: int, body: bytes = b"") -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        path = self._get_path()
+        if path is None or not path.is_file():
+            self._send(404)
+        else:
+            self._send(200, path.read_bytes())
+
+    def do_PUT(self) -> None:
+        path = self._get_path()
+        if path is None:
+            self._send(400)
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self.headers.get("If-None-Match") == "*":
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                self._send(412)
+                return
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+        else:
+            tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, path)
+        self._send(201)
+
+    def do_DELETE(self) -> None:
+        path = self._get_path()
+        if path is None:
+            self._send(400)
+            return
+        path.unlink(missing_ok=True)
+        self._send(204)
+
+
+class CacheServer(http.server.ThreadingHTTPServer):
+    # Render farms open many connections at once, which overflows the default listen backlog of 5.
+    request_queue_size = 128
+
+
+def serve(root: str | PathLike[str], host: str = "127.0.0.1", port: int = 8000) -> CacheServer:
+    Path(root).mkdir(parents=True, exist_ok=True)
+    handler = type("CacheRequestHandler", (CacheRequestHandler,), {"root": Path(root)})
+    return CacheServer((host, port), handler)
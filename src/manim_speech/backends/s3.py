@@ -0,0 +1,77 @@
+"""S3-compatible object store cache backend."""
+
+import os
+import time
+import uuid
+from pathlib import Path
+
+from .base import CacheBackend
+
+try:
+    import boto3
+    from botocore.exceptions import ClientError
+except ImportError:
+    raise ImportError("Please install boto3 with `pip install boto3`")
+
+
+def _is_error(e: ClientError, *codes: str) -> bool:
+    return e.response.get("Error", {}).get("Code") in codes
+
+
+class S3CacheBackend(CacheBackend):
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        *,
+        poll_interval: float = 1.0,
+        claim_timeout: float = 600.0,
+        **kwargs,
+    ) -> None:
+        self.client = boto3.client("s3", **kwargs)
+        self.bucket = bucket
+        self.prefix = prefix
+        self.poll_interval = poll_interval
+        self.claim_timeout = claim_timeout
+
+    def _get_object_key(self, key: str, name: str) -> str:
+        return f"{self.prefix}{key}/{name}"
+
+    def get(self, key: str, name: str, out_path: Path) -> bool:
+        tmp_path = out_path.with_name(f".{out_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            self.client.download_file(self.bucket, self._get_object_key(key, name), os.fspath(tmp_path))
+            os.replace(tmp_path, out_path)
+        except ClientError as e:
+            if _is_error(e, "404", "NoSuchKey"):
+                return False
+            raise
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return True
+
+    def put(self, key: str, name: str, in_path: Path) -> None:
+        self.client.upload_file(os.fspath(in_path), self.bucket, self._get_object_key(key, name))
+
+    def claim(self, key: str, name: str) -> bool:
+        lock_key = self._get_object_key(key, f"{name}.lock")
+        for _ in range(2):
+            try:
+                self.client.put_object(Bucket=self.bucket, Key=lock_key, Body=b"", IfNoneMatch="*")
+                return True
+            except ClientError as e:
+                if not _is_error(e, "PreconditionFailed", "ConditionalRequestConflict", "412"):
+                    raise
+            try:
+                response = self.client.head_object(Bucket=self.bucket, Key=lock_key)
+            except ClientError as e:
+                if _is_error(e, "404", "NoSuchKey"):
+                    continue
+                raise
+            if time.time() - response["LastModified"].timestamp() <= self.claim_timeout:
+                return False
+            self.client.delete_object(Bucket=self.bucket, Key=lock_key)
+        return False
+
+    def release(self, key: str, name: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._get_object_key(key, f"{name}.lock"))
@@ -0,0 +1,58 @@
+"""Shared filesystem cache backend."""
+
+import os
+import shutil
+import time
+import uuid
+from os import PathLike
+from pathlib import Path
+
+from .base import CacheBackend
+
+
+def _copy_atomic(src: Path, dst: Path) -> None:
+    tmp_path = dst.with_name(f".{dst.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        shutil.copyfile(src, tmp_path)
+        os.replace(tmp_path, dst)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+class SharedDirectoryCacheBackend(CacheBackend):
+    def __init__(self, root: str | PathLike[str], *, poll_interval: float = 1.0, claim_timeout: float = 600.0) -> None:
+        self.root = Path(root)
+        self.poll_interval = poll_interval
+        self.claim_timeout = claim_timeout
+
+    def get(self, key: str, name: str, out_path: Path) -> bool:
+        src_path = self.root / key / name
+        if not src_path.exists():
+            return False
+        _copy_atomic(src_path, out_path)
+        return True
+
+    def put(self, key: str, name: str, in_path: Path) -> None:
+        (self.root / key).mkdir(parents=True, exist_ok=True)
+        _copy_atomic(in_path, self.root / key / name)
+
+    def claim(self, key: str, name: str) -> bool:
+        lock_path = self.root / key / f"{name}.lock"
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        for _ in range(2):
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    if time.time() - lock_path.stat().st_mtime <= self.claim_timeout:
+                        return False
+                except FileNotFoundError:
+                    continue
+                lock_path.unlink(missing_ok=True)
+            else:
+                os.close(fd)
+                return True
+        return False
+
+    def release(self, key: str, name: str) -> None:
+        (self.root / key / f"{name}.lock").unlink(missing_ok=True)
@@ -0,0 +1,307 @@
+"""Voiceover cache for Manim Speech."""
+
+import argparse
+import contextlib
+import hashlib
+import logging
+import os
+import re
+import shutil
+import sqlite3
+import sys
+import time
+import uuid
+from collections import abc
+from os import PathLike
+from pathlib import Path
+from typing import IO, Self
+
+from pydantic import BaseModel
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+INDEX_FILE = "index.sqlite3"
+METADATA_FILE = "metadata.json"
+LOCK_FILE = ".lock"
+CACHE_DIR_ENV_VAR = "MANIM_SPEECH_CACHE_DIR"
+
+logger = logging.getLogger("manim")
+
+
+class FileRecord(BaseModel):
+    size: int
+    sha256: str
+    mtime_ns: int = 0
+
+    def matches(self, other: "FileRecord") -> bool:
+        # Compares contents only, as a file restored with the same bytes gets a new modification time.
+        return self.size == other.size and self.sha256 == other.sha256
+
+
+class AudioInfo(BaseModel):
+    duration: float
+    sample_rate: int
+    codec: str
+
+
+class ProcessingRecord(BaseModel):
+    source: FileRecord
+    trim_start: float
+
+
+class EntryMetadata(BaseModel):
+    text: str
+    tts_fingerprint: str
+    stt_fingerprint: str | None = None
+    files: dict[str, FileRecord] = {}
+    audio: AudioInfo | None = None
+    processing: ProcessingRecord | None = None
+    # Keys of the entries this one is derived from, which are used whenever it is.
+    sources: list[str] = []
+
+
+def get_cache_dir(cache_dir: str | PathLike[str] | None = None) -> Path:
+    if cache_dir is None:
+        cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if not cache_dir:
+        # Manim is only loaded to find its media directory, so workers given a cache directory do not import it.
+        import manim
+
+        cache_dir = Path(manim.config.media_dir) / "manim_speech"
+    elif not isinstance(cache_dir, Path):
+        cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def read_metadata(entry_path: Path) -> EntryMetadata | None:
+    metadata_path = entry_path / METADATA_FILE
+    if not metadata_path.exists():
+        return None
+    with metadata_path.open() as f:
+        return EntryMetadata.model_validate_json(f.read())
+
+
+def get_temp_path(path: Path) -> Path:
+    return path.with_name(f".{path.stem}.{uuid.uuid4().hex}{path.suffix}")
+
+
+def write_metadata(entry_path: Path, metadata: EntryMetadata) -> None:
+    tmp_path = get_temp_path(entry_path / METADATA_FILE)
+    try:
+        with tmp_path.open("w") as f:
+            f.write(metadata.model_dump_json(indent=4))
+        os.replace(tmp_path, entry_path / METADATA_FILE)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def get_file_record(path: Path) -> FileRecord:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    stat = path.stat()
+    return FileRecord(size=stat.st_size, sha256=digest.hexdigest(), mtime_ns=stat.st_mtime_ns)
+
+
+def is_valid(entry_path: Path, name: str, metadata: EntryMetadata | None = None) -> bool:
+    if metadata is None:
+        metadata = read_metadata(entry_path)
+    path = entry_path / name
+    if metadata is None or name not in metadata.files or not path.exists():
+        return False
+    record = metadata.files[name]
+    stat = path.stat()
+    if stat.st_size != record.size:
+        return False
+    # Files are only hashed again when they were modified after being recorded.
+    return stat.st_mtime_ns == record.mtime_ns or get_file_record(path).matches(record)
+
+
+class EntryLock:
+    def __init__(self, entry_path: Path) -> None:
+        self.path = entry_path / LOCK_FILE
+        self.file: IO[bytes] | None = None
+
+    def acquire(self) -> None:
+        self.file = self.path.open("a+b")
+        if sys.platform == "win32":
+            self.file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self.file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+
+    def release(self) -> None:
+        if self.file is None:
+            return
+        if sys.platform == "win32":
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        self.file.close()
+        self.file = None
+
+    def __enter__(self) -> Self:
+        self.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+
+def _get_entry_size(entry_path: Path) -> int:
+    return sum(path.stat().st_size for path in entry_path.iterdir() if path.is_file())
+
+
+class CacheIndex:
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+        self.path = cache_dir / INDEX_FILE
+
+    @contextlib.contextmanager
+    def _connect(self) -> abc.Generator[sqlite3.Connection, None, None]:
+        with contextlib.closing(sqlite3.connect(self.path, timeout=30.0)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            yield conn
+
+    def touch(self, key: str) -> None:
+        entry_path = self.cache_dir / key
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, size, last_access) VALUES (?, ?, ?)",
+                (key, _get_entry_size(entry_path), time.time()),
+            )
+
+    def touch_many(self, keys: abc.Iterable[str]) -> None:
+        # Only updates the access time of indexed entries, without measuring their size.
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany("UPDATE entries SET last_access = ? WHERE key = ?", [(now, key) for key in keys])
+
+    def entries(self) -> list[tuple[str, int, float]]:
+        with self._connect() as conn:
+            return conn.execute("SELECT key, size, last_access FROM entries ORDER BY last_access").fetchall()
+
+    def sync(self) -> None:
+        indexed = {key for key, _, _ in self.entries()}
+        on_disk = {path.name for path in self.cache_dir.iterdir() if path.is_dir()}
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in indexed - on_disk])
+            conn.executemany(
+                "INSERT INTO entries (key, size, last_access) VALUES (?, ?, ?)",
+                [
+                    (key, _get_entry_size(self.cache_dir / key), (self.cache_dir / key).stat().st_mtime)
+                    for key in on_disk - indexed
+                ],
+            )
+
+    def remove(self, keys: abc.Iterable[str]) -> None:
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in keys])
+
+
+def prune(
+    cache_dir: str | PathLike[str] | None = None,
+    *,
+    max_size: int | None = None,
+    max_age: float | None = None,
+) -> list[str]:
+    cache_dir = get_cache_dir(cache_dir)
+    index = CacheIndex(cache_dir)
+    index.sync()
+
+    entries = index.entries()
+    total_size = sum(size for _, size, _ in entries)
+    now = time.time()
+    evicted: list[str] = []
+    for key, size, last_access in entries:
+        if (max_age is not None and now - last_access > max_age) or (max_size is not None and total_size > max_size):
+            shutil.rmtree(cache_dir / key, ignore_errors=True)
+            evicted.append(key)
+            total_size -= size
+    index.remove(evicted)
+
+    logger.info(f"Evicted {len(evicted)} voiceovers from {cache_dir}.")
+    return evicted
+
+
+def _parse_quantity(value: str, units: dict[str, float]) -> float:
+    match = re.fullmatch(r"\s*([\d.]+)\s*([a-zA-Z]*)\s*", value)
+    if match is None or match.group(2).lower() not in units:
+        raise argparse.ArgumentTypeError(f'Invalid value "{value}", expected a number followed by one of {list(units)}')
+    return float(match.group(1)) * units[match.group(2).lower()]
+
+
+def _parse_size(value: str) -> int:
+    return int(_parse_quantity(value, {"": 1, "b": 1, "k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}))
+
+
+def _parse_age(value: str) -> float:
+    return _parse_quantity(value, {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800})
+
+
+def main(argv: abc.Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="manim-speech-cache", description="Manage the Manim Speech voiceover cache.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    prune_parser = subparsers.add_parser("prune", help="Evict least recently used voiceovers.")
+    prune_parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help=f"Voiceover cache directory, defaults to ${CACHE_DIR_ENV_VAR} or the `manim_speech` media directory.",
+    )
+    prune_parser.add_argument("--max-size", type=_parse_size, default=None, help="Size budget, e.g. `10G`.")
+    prune_parser.add_argument("--max-age", type=_parse_age, default=None, help="Age budget, e.g. `30d`.")
+    serve_parser = subparsers.add_parser("serve", help="Serve a shared cache over HTTP for `HTTPCacheBackend`.")
+    serve_parser.add_argument("root", help="Directory to store the shared cache in.")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Address to listen on.")
+    serve_parser.add_argument("--port", type=int, default=8000, help="Port to listen on.")
+    import_parser = subparsers.add_parser("import-po", help="Import `.po` files into the translation memory.")
+    import_parser.add_argument("files", nargs="+", help="`.po` files to import.")
+    import_parser.add_argument("-s", "--source-language", required=True, help="Language of the messages.")
+    import_parser.add_argument("-t", "--target-language", required=True, help="Language of the translations.")
+    import_service = import_parser.add_mutually_exclusive_group(required=True)
+    import_service.add_argument("--service", help="Translation service to reuse the translations for.")
+    import_service.add_argument(
+        "--fingerprint", help="Fingerprint of the translation service, to import without credentials for it."
+    )
+    import_parser.add_argument("--memory", default=None, help="Translation memory database file.")
+    args = parser.parse_args(argv)
+
+    import manim
+
+    if args.command == "prune":
+        cache_dir = get_cache_dir(args.cache_dir)
+        evicted = prune(cache_dir, max_size=args.max_size, max_age=args.max_age)
+        manim.console.print(f"Evicted {len(evicted)} voiceovers from {cache_dir}.")
+    elif args.command == "serve":
+        from .backends.http import serve
+
+        manim.console.print(f"Serving {args.root} on http://{args.host}:{args.port}.")
+        with serve(args.root, args.host, args.port) as server:
+            server.serve_forever()
+    elif args.command == "import-po":
+        from .driver import _load_translation_service
+        from .translation import TranslationMemory
+
+        memory = TranslationMemory(args.memory)
+        provider = args.fingerprint or _load_translation_service(args.service).fingerprint
+        for file in args.files:
+            count = memory.import_po_file(file, args.source_language, args.target_language, provider)
+            manim.console.print(f"Imported {count} translations from {file} into {memory.path}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Multi-language translation and render driver for Manim Speech."""
+
+import argparse
+import importlib
+import importlib.util
+import os
+from collections import abc
+from concurrent import futures
+from os import PathLike
+from pathlib import Path
+from typing import Any
+
+import manim
+
+from . import cache, services, translation
+
+TRANSLATION_SERVICES = {
+    "deepl": "manim_speech.services.deepl:DeepLTranslationService",
+}
+
+
+def _load_translation_service(name: str) -> services.TranslationService:
+    module_name, _, class_name = TRANSLATION_SERVICES.get(name, name).partition(":")
+    if not class_name:
+        raise ValueError(f'Translation service must be one of {list(TRANSLATION_SERVICES)} or "module:Class"')
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+def _render_scene(
+    file: str, scene_name: str, language: str, media_dir: str, cache_dir: str, config: dict[str, Any]
+) -> tuple[str, str, Path | None]:
+    os.environ[translation.LANGUAGE_ENV_VAR] = language
+    os.environ[cache.CACHE_DIR_ENV_VAR] = cache_dir
+    spec = importlib.util.spec_from_file_location(Path(file).stem, file)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    with manim.tempconfig({**config, "media_dir": media_dir}):
+        scene = getattr(module, scene_name)()
+        scene.render()
+        return language, scene_name, scene.renderer.file_writer.movie_file_path
+
+
+def render_translations(
+    file: str | PathLike[str],
+    scene_names: abc.Sequence[str],
+    domain: str,
+    source_language: str,
+    target_languages: abc.Sequence[str],
+    *,
+    service: services.TranslationService | None = None,
+    memory: translation.TranslationMemory | None = None,
+    media_dir: str | PathLike[str] = "media",
+    cache_dir: str | PathLike[str] | None = None,
+    max_workers: int | None = None,
+    config: dict[str, Any] | None = None,
+) -> dict[tuple[str, str], Path | None]:
+    translation.init_translation_env(file, domain)
+    # All languages share one voiceover cache, so voiceovers prefetched for other languages are found by their renders.
+    if cache_dir is None:
+        cache_dir = Path(media_dir) / "manim_speech"
+
+    with futures.ThreadPoolExecutor(max_workers=len(target_languages) or None) as pool:
+        for job in [
+            pool.submit(
+                translation.translate_po_file, domain, source_language, language, service=service, memory=memory
+            )
+            for language in target_languages
+        ]:
+            job.result()
+
+    results: dict[tuple[str, str], Path | None] = {}
+    with futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+        jobs = [
+            pool.submit(
+                _render_scene,
+                os.fspath(Path(file).resolve()),
+                scene_name,
+                language,
+                os.fspath(Path(media_dir) / language),
+                os.fspath(Path(cache_dir).resolve()),
+                config or {},
+            )
+            for language in target_languages
+            for scene_name in scene_names
+        ]
+        for job in futures.as_completed(jobs):
+            language, scene_name, movie_path = job.result()
+            manim.logger.info(f"Rendered {scene_name} in {language} to {movie_path}.")
+            results[(language, scene_name)] = movie_path
+    return results
+
+
+def main(argv: abc.Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="manim-speech-translate", description="Translate and render Manim Speech scenes in multiple languages."
+    )
+    parser.add_argument("file", help="Python file containing the scenes.")
+    parser.add_argument("scenes", nargs="+", help="Names of the scenes to render.")
+    parser.add_argument("-d", "--domain", required=True, help="gettext domain passed to `TranslationScene.translate`.")
+    parser.add_argument("-s", "--source-language", required=True, help="Language of the source text.")
+    parser.add_argument("-t", "--target-languages", nargs="+", required=True, help="Languages to render.")
+    parser.add_argument(
+        "--service", default=None, help=f'Translation service, one of {list(TRANSLATION_SERVICES)} or "module:Class".'
+    )
+    parser.add_argument(
+        "--no-translation-memory", action="store_true", help="Do not reuse translations from other scenes or projects."
+    )
+    parser.add_argument("--media-dir", default="media", help="Base media directory, one subdirectory per language.")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Number of render processes.")
+    parser.add_argument("-q", "--quality", default=None, help="Manim render quality, e.g. `low_quality`.")
+    args = parser.parse_args(argv)
+
+    render_translations(
+        args.file,
+        args.scenes,
+        args.domain,
+        args.source_language,
+        args.target_languages,
+        service=_load_translation_service(args.service) if args.service is not None else None,
+        memory=None if args.no_translation_memory else translation.TranslationMemory(),
+        media_dir=args.media_dir,
+        max_workers=args.jobs,
+        config={"quality": args.quality} if args.quality is not None else None,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""OpenTelemetry exporter for Manim Speech telemetry."""
+
+import threading
+
+from . import telemetry
+
+try:
+    from opentelemetry import metrics, trace
+except ImportError:
+    raise ImportError("Please install opentelemetry-api with `pip install opentelemetry-api`")
+
+INSTRUMENTATION_NAME = "manim_speech"
+
+
+class OpenTelemetryHook(telemetry.Hook):
+    # Spans are exported when they end, so they are recorded with their original start time and without parents.
+    def __init__(
+        self,
+        *,
+        tracer_provider: trace.TracerProvider | None = None,
+        meter_provider: metrics.MeterProvider | None = None,
+    ) -> None:
+        self.tracer = trace.get_tracer(INSTRUMENTATION_NAME, tracer_provider=tracer_provider)
+        self.meter = metrics.get_meter(INSTRUMENTATION_NAME, meter_provider=meter_provider)
+        self.durations = self.meter.create_histogram(
+            "manim_speech.stage.duration", unit="s", description="Duration of Manim Speech pipeline stages."
+        )
+        self.counters: dict[str, metrics.Counter] = {}
+        self.lock = threading.Lock()
+
+    def _get_counter(self, name: str) -> metrics.Counter:
+        with self.lock:
+            if name not in self.counters:
+                self.counters[name] = self.meter.create_counter(f"manim_speech.{name}")
+            return self.counters[name]
+
+    def on_span(self, span: telemetry.Span) -> None:
+        start = int(span.start * 1e9)
+        otel_span = self.tracer.start_span(f"manim_speech.{span.name}", start_time=start, attributes=span.attributes)
+        if span.error is not None:
+            otel_span.set_status(trace.Status(trace.StatusCode.ERROR, span.error))
+        otel_span.end(end_time=start + int(span.duration * 1e9))
+        self.durations.record(span.duration, {"stage": span.name, **span.attributes})
+
+    def on_count(self, name: str, value: float, attributes: telemetry.Attributes) -> None:
+        self._get_counter(name).add(value, attributes)
@@ -2,19 +2,32 @@
 
 import contextlib
 import gettext
+import os
 from collections import abc
 from os import PathLike
 
 import manim
 
-from . import services, translation, voiceover
+from . import audio, backends, cache, services, telemetry, translation, voiceover
 
 
 class VoiceoverScene(manim.Scene):
     tts_service: services.TTSService | None = None
     stt_service: services.STTService | None = None
-    current_voiceover_data: voiceover.VoiceoverData | None = None
+    current_voiceover_data: voiceover.VoiceoverData | voiceover.StreamingVoiceover | None = None
     current_voiceover_start_time: float | None = None
+    cache_backend: backends.CacheBackend | None = None
+    cache_max_size: int | None = None
+    cache_max_age: float | None = None
+    stream_voiceovers: bool = True
+    voiceover_chunk_size: int | None = None
+    cache_only: bool = False
+    voiceover_audio_format: str = "mp3"
+    voiceover_post_processing: audio.PostProcessing | None = None
+    batch_stt: bool = False
+    voiceover_manifest: voiceover.Manifest | None = None
+    speech_report: bool = True
+    speech_telemetry: telemetry.Report | None = None
 
     def set_tts_service(self, service: services.TTSService) -> None:
         self.tts_service = service
@@ -22,41 +35,238 @@ class VoiceoverScene(manim.Scene):
     def set_stt_service(self, service: services.STTService) -> None:
         self.stt_service = service
 
+    def set_cache_backend(self, backend: backends.CacheBackend) -> None:
+        self.cache_backend = backend
+
+    def is_cache_only(self) -> bool:
+        return self.cache_only or os.environ.get(voiceover.CACHE_ONLY_ENV_VAR, "") not in ("", "0")
+
+    def prefetch_voiceovers(self, texts: abc.Iterable[str]) -> None:
+        if not self.is_cache_only():
+            voiceover.prefetch(
+                texts,
+                self.tts_service,
+                self.stt_service,
+                backend=self.cache_backend,
+                chunk_size=self.voiceover_chunk_size,
+                post_processing=self.voiceover_post_processing,
+                batch_stt=self.batch_stt,
+            )
+            return
+        # Checks every clip before any animation is rendered, instead of failing at the first missing one.
+        if self.voiceover_manifest is not None:
+            texts = [
+                text
+                for text in texts
+                if self.voiceover_manifest.get(text, self.tts_service, self.stt_service, self.voiceover_post_processing)
+                is None
+            ]
+        missing = voiceover.find_missing(
+            texts,
+            self.tts_service,
+            self.stt_service,
+            backend=self.cache_backend,
+            chunk_size=self.voiceover_chunk_size,
+            post_processing=self.voiceover_post_processing,
+        )
+        if missing:
+            raise RuntimeError(
+                f"{len(missing)} voiceovers are not cached:\n" + "\n".join(f"  {text!r}" for text in missing)
+            )
+
+    def setup(self) -> None:
+        super().setup()
+        self.speech_telemetry = telemetry.Report()
+        telemetry.add_hook(self.speech_telemetry)
+        self.voiceover_manifest = voiceover.Manifest.for_scene(
+            type(self).__name__,
+            language=os.environ.get(translation.LANGUAGE_ENV_VAR) or getattr(self, "target_language", None),
+        )
+        if self.is_cache_only():
+            missing = self.voiceover_manifest.missing()
+            if missing:
+                raise RuntimeError(
+                    f"{len(missing)} voiceovers of the last render of {type(self).__name__} are no longer cached:\n"
+                    + "\n".join(f"  {entry.text!r}" for entry in missing)
+                )
+
+    def tear_down(self) -> None:
+        super().tear_down()
+        if self.voiceover_manifest is not None:
+            self.voiceover_manifest.save()
+        if self.cache_max_size is not None or self.cache_max_age is not None:
+            cache.prune(max_size=self.cache_max_size, max_age=self.cache_max_age)
+        if self.speech_telemetry is not None:
+            telemetry.remove_hook(self.speech_telemetry)
+            if self.speech_report and self.speech_telemetry:
+                manim.console.print(
+                    f"Speech report for {type(self).__name__}:\n{self.speech_telemetry.format()}",
+                    markup=False,
+                    highlight=False,
+                )
+
+    def render(self, preview: bool = False) -> bool | None:
+        # tear_down is skipped when construct raises or the scene is rerun, so the hook is removed here as well.
+        try:
+            return super().render(preview)
+        finally:
+            if self.speech_telemetry is not None:
+                telemetry.remove_hook(self.speech_telemetry)
+
     def safe_wait(self, duration: float) -> None:
         if duration > 1 / manim.config.frame_rate:
             self.wait(duration)
 
+    def _wait_until(self, time: float) -> None:
+        # Rounded on the absolute frame index, so rounding errors do not accumulate over many bookmarks.
+        frames = round(time * manim.config.frame_rate) - round(self.renderer.time * manim.config.frame_rate)
+        if frames > 0:
+            self.wait(frames / manim.config.frame_rate)
+
     def wait_for_voiceover(self) -> None:
         if not (self.current_voiceover_data is None) and not (self.current_voiceover_start_time is None):
-            self.safe_wait(
-                self.current_voiceover_data.duration - (self.renderer.time - self.current_voiceover_start_time)
-            )
+            self._wait_until(self.current_voiceover_start_time + self.current_voiceover_data.duration)
 
     def wait_until_bookmark(self, key: str) -> None:
         if not (self.current_voiceover_data is None) and not (self.current_voiceover_start_time is None):
-            self.safe_wait(
-                self.current_voiceover_data.bookmarks.get(key, 0.0)
-                - (self.renderer.time - self.current_voiceover_start_time)
-            )
+            self._wait_until(self.current_voiceover_start_time + self.current_voiceover_data.get_bookmark(key))
+
+    def play_timeline(
+        self, timeline: abc.Iterable[tuple[str | float, manim.Animation | abc.Sequence[manim.Animation] | None]]
+    ) -> None:
+        # Plays each animation at a bookmark (or a time in seconds) of the current voiceover. Animations due on the
+        # same frame are played together, and consecutive waits are merged, so the timeline renders as few segments
+        # as possible. While a voiceover is streaming, the animations due are played before the next bookmark is
+        # resolved, so they never wait for the alignment of later words.
+        data = self.current_voiceover_data
+        if data is None or self.current_voiceover_start_time is None:
+            raise RuntimeError("play_timeline must be called inside a voiceover block")
+        start = self.current_voiceover_start_time
+        frame_rate = manim.config.frame_rate
+        pending: list[manim.Animation] = []
+        pending_mark: str | float | None = None
+        pending_time = start
+
+        def play_pending() -> None:
+            self._wait_until(pending_time)
+            self.play(*pending)
+            pending.clear()
+
+        for mark, animations in timeline:
+            streaming = isinstance(data, voiceover.StreamingVoiceover) and not data.future.done()
+            if pending and streaming and mark != pending_mark:
+                play_pending()
+            time = start + (data.get_bookmark(mark) if isinstance(mark, str) else mark)
+            if pending and round(time * frame_rate) > round(pending_time * frame_rate):
+                play_pending()
+            pending_mark = mark
+            pending_time = max(pending_time, time)
+            if isinstance(animations, manim.Animation):
+                pending.append(animations)
+            elif animations is not None:
+                pending.extend(animations)
+        if pending:
+            play_pending()
+        else:
+            self._wait_until(pending_time)
+
+    def _voiceover_text(self, text: str) -> str:
+        # Hook for subclasses that rewrite voiceover texts, e.g. to translate them.
+        return text
 
     @contextlib.contextmanager
-    def voiceover(self, text: str) -> abc.Generator[voiceover.VoiceoverData, None, None]:
+    def voiceover(self, text: str) -> abc.Generator[voiceover.VoiceoverData | voiceover.StreamingVoiceover, None, None]:
+        text = self._voiceover_text(text)
         if self.stt_service is None:
-            manim.logger.warning("No STT service is set. Bookmark locations will be inaccurate.")
+            manim.logger.warning(
+                "No STT service is set. Bookmark locations will be inaccurate unless the TTS service returns timestamps."
+            )
+        cache_only = self.is_cache_only()
+        data = (
+            self.voiceover_manifest.get(text, self.tts_service, self.stt_service, self.voiceover_post_processing)
+            if self.voiceover_manifest is not None
+            else None
+        )
+        streaming = (
+            data is None
+            and not cache_only
+            and self.voiceover_post_processing is None
+            and self.stream_voiceovers
+            and self.tts_service is not None
+            and self.tts_service.supports_streaming
+        )
+        failed = False
         try:
-            self.current_voiceover_data = voiceover.create(text, self.tts_service, self.stt_service)
+            if data is not None:
+                self.current_voiceover_data = data
+            elif streaming:
+                # Animations are rendered while the audio downloads, and the sound is added once it is complete.
+                self.current_voiceover_data = voiceover.create_streaming(
+                    text,
+                    self.tts_service,
+                    self.stt_service,
+                    backend=self.cache_backend,
+                    chunk_size=self.voiceover_chunk_size,
+                )
+            else:
+                self.current_voiceover_data = voiceover.create(
+                    text,
+                    self.tts_service,
+                    self.stt_service,
+                    backend=self.cache_backend,
+                    chunk_size=self.voiceover_chunk_size,
+                    cache_only=cache_only,
+                    post_processing=self.voiceover_post_processing,
+                )
             self.current_voiceover_start_time = self.renderer.time
-            if (self.current_voiceover_data.path / "audio.mp3").exists():
-                self.add_sound(str(self.current_voiceover_data.path / "audio.mp3"))
+            if not streaming and (self.current_voiceover_data.path / "audio.mp3").exists():
+                self.add_sound(
+                    str(voiceover.get_audio_path(self.current_voiceover_data.path, self.voiceover_audio_format))
+                )
             yield self.current_voiceover_data
+        except BaseException:
+            # Waiting would re-raise a failed stream from the `finally` block and hide the original exception.
+            failed = True
+            raise
         finally:
-            self.wait_for_voiceover()
+            if not failed:
+                self.wait_for_voiceover()
+            if (
+                not failed
+                and data is None
+                and self.voiceover_manifest is not None
+                and self.current_voiceover_data is not None
+            ):
+                self.voiceover_manifest.add(
+                    text,
+                    self.tts_service,
+                    self.stt_service,
+                    self.current_voiceover_data.result()
+                    if isinstance(self.current_voiceover_data, voiceover.StreamingVoiceover)
+                    else self.current_voiceover_data,
+                    self.voiceover_post_processing,
+                )
+            if (
+                not failed
+                and streaming
+                and self.current_voiceover_data is not None
+                and self.current_voiceover_start_time is not None
+                and (self.current_voiceover_data.path / "audio.mp3").exists()
+            ):
+                self.add_sound(
+                    str(voiceover.get_audio_path(self.current_voiceover_data.path, self.voiceover_audio_format)),
+                    time_offset=self.current_voiceover_start_time - self.renderer.time,
+                )
             self.current_voiceover_data = None
             self.current_voiceover_start_time = None
 
 
 class TranslationScene(manim.Scene):
     translation_service: services.TranslationService | None = None
+    translation_memory: translation.TranslationMemory | None = None
+    use_translation_memory: bool = True
+    source_language: str | None = None
+    target_language: str | None = None
     __slots__ = ["_"]
 
     def set_translation_service(self, service: services.TranslationService) -> None:
@@ -69,7 +279,65 @@ class TranslationScene(manim.Scene):
         source_language: str,
         target_language: str,
     ) -> None:
-        translation.init_translation_env(file, domain)
-        translation.translate_po_file(domain, source_language, target_language, service=self.translation_service)
+        if self.translation_memory is None and self.use_translation_memory:
+            # Created per scene when first needed, so its location follows the environment at render time.
+            self.translation_memory = translation.TranslationMemory()
+        language = os.environ.get(translation.LANGUAGE_ENV_VAR)
+        if language is None:
+            translation.init_translation_env(file, domain)
+            translation.translate_po_file(
+                domain,
+                source_language,
+                target_language,
+                service=self.translation_service,
+                memory=self.translation_memory,
+            )
+        else:
+            # Rendering from the multi-language driver, which has already prepared the translation files.
+            target_language = language
+        self.source_language = source_language
+        self.target_language = target_language
         trans = gettext.translation(domain, languages=[target_language], localedir="locales")
         self._ = trans.gettext
+
+
+class TranslatedVoiceoverScene(VoiceoverScene, TranslationScene):
+    # Voiceover texts are written in the source language and translated when the voiceover is created.
+    def _voiceover_text(self, text: str) -> str:
+        return self.translate_voiceover(text)
+
+    def translate_voiceover(self, text: str) -> str:
+        if self.target_language is None or self.target_language == self.source_language:
+            return text
+        if self.translation_service is None:
+            return self._(text)
+        assert self.source_language is not None
+        return translation.translate_texts(
+            [text], self.source_language, self.target_language, self.translation_service, memory=self.translation_memory
+        )[0]
+
+    def prefetch_voiceovers(self, texts: abc.Iterable[str], languages: abc.Sequence[str] = ()) -> None:
+        # Voiceovers in other languages are generated along with the current one, so later renders in those languages
+        # find them in the cache.
+        if (
+            self.translation_service is None
+            or self.tts_service is None
+            or self.source_language is None
+            or self.target_language is None
+            or self.is_cache_only()
+        ):
+            super().prefetch_voiceovers([self.translate_voiceover(text) for text in texts])
+            return
+        translation.prefetch_voiceovers(
+            list(texts),
+            self.source_language,
+            list(dict.fromkeys([self.target_language, *languages])),
+            self.translation_service,
+            self.tts_service,
+            self.stt_service,
+            memory=self.translation_memory,
+            backend=self.cache_backend,
+            chunk_size=self.voiceover_chunk_size,
+            post_processing=self.voiceover_post_processing,
+            batch_stt=self.batch_stt,
+        )
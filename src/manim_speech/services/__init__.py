@@ -1,5 +1,78 @@
 """Services for Manim Speech."""
 
-from .base import Boundary, Service, STTService, Transcript, TranslationService, TTSService
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["Boundary", "STTService", "Service", "TTSService", "Transcript", "TranslationService"]
+from .base import (
+    AsyncSTTService,
+    AsyncTranslationService,
+    AsyncTTSService,
+    AudioChunk,
+    Boundary,
+    Service,
+    STTService,
+    Transcript,
+    TranscriptView,
+    TranslationService,
+    TTSService,
+)
+
+if TYPE_CHECKING:
+    from .ratelimit import RateLimiter, rate_limited
+
+# Providers import their SDKs (e.g. torch for Whisper) when loaded, so they are only loaded on first access (PEP 562).
+_LAZY_ATTRS = {
+    "RateLimiter": "ratelimit",
+    "rate_limited": "ratelimit",
+    "AssemblyAISTTService": "assemblyai",
+    "AsyncAssemblyAISTTService": "assemblyai",
+    "DaemonSTTService": "daemon",
+    "AsyncDaemonSTTService": "daemon",
+    "DeepLTranslationService": "deepl",
+    "AsyncDeepLTranslationService": "deepl",
+    "ElevenLabsTTSService": "elevenlabs",
+    "AsyncElevenLabsTTSService": "elevenlabs",
+    "ElevenLabsSTTService": "elevenlabs",
+    "AsyncElevenLabsSTTService": "elevenlabs",
+    "FasterWhisperSTTService": "faster_whisper",
+    "AsyncFasterWhisperSTTService": "faster_whisper",
+    "OpenAITTSService": "openai",
+    "AsyncOpenAITTSService": "openai",
+    "OpenAISTTService": "openai",
+    "AsyncOpenAISTTService": "openai",
+    "PiperTTSService": "piper",
+    "WhisperSTTService": "whisper",
+    "AsyncWhisperSTTService": "whisper",
+}
+_LAZY_MODULES = frozenset(_LAZY_ATTRS.values())
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRS, *_LAZY_MODULES})
+
+
+__all__ = [
+    "AsyncSTTService",
+    "AsyncTTSService",
+    "AsyncTranslationService",
+    "AudioChunk",
+    "Boundary",
+    "RateLimiter",
+    "STTService",
+    "Service",
+    "TTSService",
+    "Transcript",
+    "TranscriptView",
+    "TranslationService",
+    "rate_limited",
+]
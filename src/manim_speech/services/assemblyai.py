@@ -1,9 +1,10 @@
 """AssemblyAI services."""
 
+import asyncio
 import os
 from os import PathLike
 
-from .base import Boundary, Service, STTService, Transcript
+from .base import AsyncSTTService, Boundary, Service, STTService, Transcript, find_word
 
 try:
     import assemblyai as aai
@@ -11,6 +12,28 @@ except ImportError:
     raise ImportError("Please install assemblyai with `pip install assemblyai`")
 
 
+def _parse_transcription(response: aai.Transcript) -> Transcript:
+    if response.error:
+        raise ValueError(response.error)
+
+    word_boundaries: list[Boundary] = []
+    text_offset = 0
+    assert response.words is not None and response.text is not None
+    for word in response.words:
+        text_start = find_word(response.text, word.text, text_offset)
+        word_boundaries.append(
+            Boundary(
+                text=word.text,
+                start=word.start / 1000,
+                end=word.end / 1000,
+                text_start=text_start,
+            )
+        )
+        text_offset = text_start + len(word.text)
+
+    return Transcript(text=response.text, boundaries=word_boundaries)
+
+
 class AssemblyAIService(Service):
     def __init__(self, *, api_key: str | None = None) -> None:
         if api_key is None:
@@ -26,10 +49,15 @@ class AssemblyAIService(Service):
 
 
 class AssemblyAISTTService(STTService, AssemblyAIService):
+    fingerprint_attrs = ("model", "language", "kwargs")
+
     def __init__(
         self, model: str = "universal-3-5-pro", language: str | None = None, *, api_key: str | None = None, **kwargs
     ) -> None:
         super().__init__(api_key=api_key)
+        self.model = model
+        self.language = language
+        self.kwargs = kwargs
         self.config = aai.TranscriptionConfig(
             speech_models=[model],
             language_code=language,
@@ -41,22 +69,28 @@ class AssemblyAISTTService(STTService, AssemblyAIService):
     def stt(self, in_path: str | PathLike[str]) -> Transcript:
         aai.settings.api_key = self.api_key
         response = aai.Transcriber(config=self.config).transcribe(os.fspath(in_path))
-        if response.error:
-            raise ValueError(response.error)
-
-        word_boundaries: list[Boundary] = []
-        text_offset = 0
-        assert response.words is not None and response.text is not None
-        for word in response.words:
-            text_start = response.text.find(word.word, text_offset)
-            word_boundaries.append(
-                Boundary(
-                    text=word.text,
-                    start=word.start / 1000,
-                    end=word.end / 1000,
-                    text_start=text_start,
-                )
-            )
-            text_offset = text_start + len(word.text)
+        return _parse_transcription(response)
+
 
-        return Transcript(text=response.text, boundaries=word_boundaries)
+class AsyncAssemblyAISTTService(AsyncSTTService, AssemblyAIService):
+    fingerprint_attrs = ("model", "language", "kwargs")
+
+    def __init__(
+        self, model: str = "universal-3-5-pro", language: str | None = None, *, api_key: str | None = None, **kwargs
+    ) -> None:
+        super().__init__(api_key=api_key)
+        self.model = model
+        self.language = language
+        self.kwargs = kwargs
+        self.config = aai.TranscriptionConfig(
+            speech_models=[model],
+            language_code=language,
+            language_detection=(language is None),
+            punctuate=False,
+            **kwargs,
+        )
+
+    async def stt(self, in_path: str | PathLike[str]) -> Transcript:
+        aai.settings.api_key = self.api_key
+        response = await asyncio.wrap_future(aai.Transcriber(config=self.config).transcribe_async(os.fspath(in_path)))
+        return _parse_transcription(response)
@@ -1,12 +1,28 @@
 """Base classes for services."""
 
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+import tempfile
 from abc import ABC, abstractmethod
+from collections import abc
 from os import PathLike
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Self
 
 from pydantic import BaseModel, computed_field
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class Service(ABC):
+    max_concurrency: int = 4
+    fingerprint_attrs: tuple[str, ...] = ()
+
     @property
     @abstractmethod
     def service_name(self) -> str: ...
@@ -15,14 +31,20 @@ class Service(ABC):
     @abstractmethod
     def service_type(self) -> str: ...
 
-
-class TTSService(Service):
     @property
-    def service_type(self) -> str:
-        return "TTS"
+    def fingerprint(self) -> str:
+        params = {attr: getattr(self, attr) for attr in self.fingerprint_attrs}
+        params.update(service_name=self.service_name, service_type=self.service_type)
+        return hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
 
-    @abstractmethod
-    def tts(self, text: str, out_path: str | PathLike[str]) -> None: ...
+
+def find_word(text: str, word: str, start: int) -> int:
+    # Providers may normalize a word differently from the full transcript text (case, spacing, punctuation), in which
+    # case `str.find` returns -1 and every later offset would be wrong.
+    index = text.find(word, start)
+    if index == -1 and word.strip():
+        index = text.lower().find(word.strip().lower(), start)
+    return index if index != -1 else min(start, len(text))
 
 
 class Boundary(BaseModel):
@@ -47,6 +69,115 @@ class Transcript(BaseModel):
     boundaries: list[Boundary]
 
 
+class TranscriptView:
+    # Array-backed transcript; `Boundary` objects are only built when `boundaries` is accessed.
+    def __init__(
+        self, text: str, words: np.ndarray, starts: np.ndarray, ends: np.ndarray, text_starts: np.ndarray
+    ) -> None:
+        self.text = text
+        self.words = words
+        self.starts = starts
+        self.ends = ends
+        self.text_starts = text_starts
+
+    @classmethod
+    def from_boundaries(cls, text: str, boundaries: abc.Sequence[Boundary] | abc.Sequence[dict]) -> Self:
+        # numpy is imported here, so `import manim_speech` does not load it.
+        import numpy as np
+
+        records = [b.model_dump() if isinstance(b, Boundary) else b for b in boundaries]
+        return cls(
+            text,
+            np.array([record["text"] for record in records], dtype=str),
+            np.fromiter((record["start"] for record in records), np.float64, len(records)),
+            np.fromiter((record["end"] for record in records), np.float64, len(records)),
+            np.fromiter((record["text_start"] for record in records), np.int64, len(records)),
+        )
+
+    @classmethod
+    def from_transcript(cls, transcript: Transcript) -> Self:
+        return cls.from_boundaries(transcript.text, transcript.boundaries)
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> Self:
+        # Skips pydantic validation, which dominates loading transcripts with many words.
+        raw = json.loads(data)
+        return cls.from_boundaries(raw["text"], raw["boundaries"])
+
+    @classmethod
+    def load(cls, file: str | PathLike[str] | IO[bytes]) -> Self:
+        import numpy as np
+
+        with np.load(file) as npz:
+            return cls(str(npz["text"]), npz["words"], npz["starts"], npz["ends"], npz["text_starts"])
+
+    def save(self, file: str | PathLike[str] | IO[bytes]) -> None:
+        import numpy as np
+
+        np.savez(
+            file,
+            text=np.array(self.text),
+            words=self.words,
+            starts=self.starts,
+            ends=self.ends,
+            text_starts=self.text_starts,
+        )
+
+    def __repr__(self) -> str:
+        return f"TranscriptView(text={self.text!r}, boundaries={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, i: int) -> Boundary:
+        return Boundary(
+            text=str(self.words[i]),
+            start=float(self.starts[i]),
+            end=float(self.ends[i]),
+            text_start=int(self.text_starts[i]),
+        )
+
+    @functools.cached_property
+    def boundaries(self) -> list[Boundary]:
+        return [self[i] for i in range(len(self))]
+
+    def to_transcript(self) -> Transcript:
+        return Transcript(text=self.text, boundaries=self.boundaries)
+
+
+class AudioChunk(BaseModel):
+    data: bytes
+    boundaries: list[Boundary] = []
+
+
+class TTSService(Service):
+    supports_streaming: bool = False
+
+    @property
+    def service_type(self) -> str:
+        return "TTS"
+
+    @abstractmethod
+    def tts(self, text: str, out_path: str | PathLike[str]) -> Transcript | None: ...
+
+    def tts_stream(self, text: str) -> abc.Iterator[AudioChunk]:
+        # Services without a streaming API synthesize the whole clip, which is then yielded as a single chunk.
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_path = Path(tmp_dir) / "audio.mp3"
+            transcript = self.tts(text, out_path)
+            data = out_path.read_bytes()
+        yield AudioChunk(data=data, boundaries=transcript.boundaries if transcript is not None else [])
+
+
+class AsyncTTSService(Service):
+    @property
+    def service_type(self) -> str:
+        return "TTS"
+
+    @abstractmethod
+    async def tts(self, text: str, out_path: str | PathLike[str]) -> Transcript | None: ...
+
+
 class STTService(Service):
     @property
     def service_type(self) -> str:
@@ -55,11 +186,47 @@ class STTService(Service):
     @abstractmethod
     def stt(self, in_path: str | PathLike[str]) -> Transcript: ...
 
+    def stt_many(self, in_paths: list[str | PathLike[str]]) -> list[Transcript]:
+        return [self.stt(in_path) for in_path in in_paths]
+
+
+class AsyncSTTService(Service):
+    @property
+    def service_type(self) -> str:
+        return "STT"
+
+    @abstractmethod
+    async def stt(self, in_path: str | PathLike[str]) -> Transcript: ...
+
+    async def stt_many(self, in_paths: list[str | PathLike[str]]) -> list[Transcript]:
+        return list(await asyncio.gather(*(self.stt(in_path) for in_path in in_paths)))
+
 
 class TranslationService(Service):
+    max_batch_size: int = 1
+    max_batch_bytes: int = 128 * 1024
+
     @property
     def service_type(self) -> str:
         return "Translation"
 
     @abstractmethod
     def translate(self, text: str, src_lang: str, dst_lang: str) -> str: ...
+
+    def translate_batch(self, texts: list[str], src_lang: str, dst_lang: str) -> list[str]:
+        return [self.translate(text, src_lang, dst_lang) for text in texts]
+
+
+class AsyncTranslationService(Service):
+    max_batch_size: int = 1
+    max_batch_bytes: int = 128 * 1024
+
+    @property
+    def service_type(self) -> str:
+        return "Translation"
+
+    @abstractmethod
+    async def translate(self, text: str, src_lang: str, dst_lang: str) -> str: ...
+
+    async def translate_batch(self, texts: list[str], src_lang: str, dst_lang: str) -> list[str]:
+        return list(await asyncio.gather(*(self.translate(text, src_lang, dst_lang) for text in texts)))
@@ -0,0 +1,196 @@
+"""Local transcription daemon sharing one STT model between render processes."""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import socketserver
+import tempfile
+from collections import abc
+from os import PathLike
+from pathlib import Path
+from typing import Any
+
+from .base import AsyncSTTService, STTService, Transcript
+
+DEFAULT_SOCKET_PATH = Path(tempfile.gettempdir()) / "manim-speech-stt.sock"
+
+
+def _get_socket_path(socket_path: str | PathLike[str] | None) -> str:
+    return os.fspath(socket_path if socket_path is not None else DEFAULT_SOCKET_PATH)
+
+
+def _encode_request(op: str, **kwargs) -> bytes:
+    return json.dumps({"op": op, **kwargs}).encode() + b"\n"
+
+
+def _decode_response(line: bytes) -> dict[str, Any]:
+    if not line:
+        raise RuntimeError("STT daemon closed the connection")
+    response = json.loads(line)
+    if "error" in response:
+        raise RuntimeError(f"STT daemon failed: {response['error']}")
+    return response
+
+
+class STTRequestHandler(socketserver.StreamRequestHandler):
+    service: STTService
+
+    def _handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        if request.get("op") == "info":
+            return {"service_name": self.service.service_name, "fingerprint": self.service.fingerprint}
+        if request.get("op") == "stt":
+            transcripts = self.service.stt_many(request["paths"])
+            return {"transcripts": [transcript.model_dump(mode="json") for transcript in transcripts]}
+        raise ValueError(f"Unknown operation {request.get('op')!r}")
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                response = self._handle_request(json.loads(line))
+            except Exception as e:  # noqa: BLE001 - errors are reported to the client
+                response = {"error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class STTServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def _is_serving(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            return False
+    return True
+
+
+def serve(service: STTService, socket_path: str | PathLike[str] | None = None) -> STTServer:
+    socket_path = _get_socket_path(socket_path)
+    if _is_serving(socket_path):
+        raise RuntimeError(f"An STT daemon is already serving on {socket_path}")
+    # Nothing answers on the socket, so it is left over from a daemon that did not shut down cleanly.
+    Path(socket_path).unlink(missing_ok=True)
+    handler = type("STTRequestHandler", (STTRequestHandler,), {"service": service})
+    return STTServer(socket_path, handler)
+
+
+class DaemonSTTService(STTService):
+    def __init__(self, socket_path: str | PathLike[str] | None = None, *, timeout: float | None = None) -> None:
+        self.socket_path = _get_socket_path(socket_path)
+        self.timeout = timeout
+        info = self._request(_encode_request("info"))
+        self._service_name: str = info["service_name"]
+        self._fingerprint: str = info["fingerprint"]
+
+    @property
+    def service_name(self) -> str:
+        return self._service_name
+
+    @property
+    def fingerprint(self) -> str:
+        # Transcripts are keyed on the daemon's service so they are shared with renders that load it directly.
+        return self._fingerprint
+
+    def _request(self, data: bytes) -> dict[str, Any]:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            sock.sendall(data)
+            with sock.makefile("rb") as f:
+                return _decode_response(f.readline())
+
+    def stt(self, in_path: str | PathLike[str]) -> Transcript:
+        return self.stt_many([in_path])[0]
+
+    def stt_many(self, in_paths: list[str | PathLike[str]]) -> list[Transcript]:
+        response = self._request(
+            _encode_request("stt", paths=[os.fspath(Path(in_path).resolve()) for in_path in in_paths])
+        )
+        return [Transcript.model_validate(transcript) for transcript in response["transcripts"]]
+
+
+class AsyncDaemonSTTService(AsyncSTTService):
+    def __init__(self, socket_path: str | PathLike[str] | None = None, *, timeout: float | None = None) -> None:
+        self.sync_service = DaemonSTTService(socket_path, timeout=timeout)
+        self.socket_path = self.sync_service.socket_path
+        self.timeout = timeout
+
+    @property
+    def service_name(self) -> str:
+        return self.sync_service.service_name
+
+    @property
+    def fingerprint(self) -> str:
+        return self.sync_service.fingerprint
+
+    async def _request(self, data: bytes) -> dict[str, Any]:
+        reader, writer = await asyncio.wait_for(asyncio.open_unix_connection(self.socket_path), self.timeout)
+        try:
+            writer.write(data)
+            await asyncio.wait_for(writer.drain(), self.timeout)
+            return _decode_response(await asyncio.wait_for(reader.readline(), self.timeout))
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def stt(self, in_path: str | PathLike[str]) -> Transcript:
+        return (await self.stt_many([in_path]))[0]
+
+    async def stt_many(self, in_paths: list[str | PathLike[str]]) -> list[Transcript]:
+        response = await self._request(
+            _encode_request("stt", paths=[os.fspath(Path(in_path).resolve()) for in_path in in_paths])
+        )
+        return [Transcript.model_validate(transcript) for transcript in response["transcripts"]]
+
+
+def _load_service(args: argparse.Namespace) -> STTService:
+    if args.engine == "faster-whisper":
+        from .faster_whisper import FasterWhisperSTTService
+
+        return FasterWhisperSTTService(
+            args.model,
+            args.language,
+            device=args.device or "cpu",
+            compute_type=args.compute_type,
+            cpu_threads=args.threads or 0,
+            num_workers=args.workers,
+        )
+
+    from .whisper import WhisperSTTService
+
+    return WhisperSTTService(args.model, args.language, device=args.device, num_threads=args.threads)
+
+
+def main(argv: abc.Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="manim-speech-stt-daemon", description="Serve a Whisper model to render processes over a Unix socket."
+    )
+    parser.add_argument("--engine", choices=["whisper", "faster-whisper"], default="whisper", help="Whisper engine.")
+    parser.add_argument("--model", default="base", help="Whisper model name.")
+    parser.add_argument("--language", default=None, help="Language of the audio.")
+    parser.add_argument("--device", default=None, help="Device to run the model on.")
+    parser.add_argument("--threads", type=int, default=None, help="Number of CPU threads used by the model.")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel transcriptions (faster-whisper only).")
+    parser.add_argument("--compute-type", default="int8", help="Quantization (faster-whisper only), e.g. `int8`.")
+    parser.add_argument("--socket", default=None, help=f"Socket path, defaults to {DEFAULT_SOCKET_PATH}.")
+    args = parser.parse_args(argv)
+
+    import manim
+
+    socket_path = _get_socket_path(args.socket)
+    service = _load_service(args)
+    with serve(service, socket_path) as server:
+        manim.console.print(f"Serving {service.service_name} STT on {socket_path}.")
+        try:
+            server.serve_forever()
+        finally:
+            Path(socket_path).unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,118 @@
 """ElevenLabs services."""
 
+import asyncio
+import base64
+import functools
 import os
+from collections import abc
 from os import PathLike
 from pathlib import Path
 
-from .base import Boundary, Service, STTService, Transcript, TTSService
+from .base import (
+    AsyncSTTService,
+    AsyncTTSService,
+    AudioChunk,
+    Boundary,
+    Service,
+    STTService,
+    Transcript,
+    TTSService,
+    find_word,
+)
 
 try:
     import elevenlabs
-    from elevenlabs.client import ElevenLabs
-    from elevenlabs.types import SpeechToTextChunkResponseModel
+    from elevenlabs.client import AsyncElevenLabs, ElevenLabs
+    from elevenlabs.types import CharacterAlignmentResponseModel, SpeechToTextChunkResponseModel
 except ImportError:
     raise ImportError("Please install elevenlabs with `pip install elevenlabs`")
 
 
+def _get_api_key(api_key: str | None) -> str:
+    if api_key is None:
+        api_key = os.getenv("ELEVEN_API_KEY")
+        if api_key is None:
+            raise ValueError("ElevenLabs API key is not provided")
+    return api_key
+
+
+@functools.cache
+def _get_client(api_key: str) -> ElevenLabs:
+    return ElevenLabs(api_key=api_key)
+
+
+def _parse_transcription(response: SpeechToTextChunkResponseModel) -> Transcript:
+    boundaries: list[Boundary] = []
+    text_offset = 0
+    for word in response.words:
+        assert word.start is not None and word.end is not None
+        text_start = find_word(response.text, word.text, text_offset)
+        boundaries.append(Boundary(text=word.text, start=word.start, end=word.end, text_start=text_start))
+        text_offset = text_start + len(word.text)
+
+    return Transcript(text=response.text, boundaries=boundaries)
+
+
+class _AlignmentParser:
+    # Groups character timestamps into words, including words split across streamed chunks.
+    def __init__(self) -> None:
+        self.text = ""
+        self.word_start: int | None = None
+        self.word_start_time = 0.0
+        self.word_end_time = 0.0
+
+    def _close_word(self) -> list[Boundary]:
+        if self.word_start is None:
+            return []
+        boundary = Boundary(
+            text=self.text[self.word_start :],
+            start=self.word_start_time,
+            end=self.word_end_time,
+            text_start=self.word_start,
+        )
+        self.word_start = None
+        return [boundary]
+
+    def feed(self, alignment: CharacterAlignmentResponseModel) -> list[Boundary]:
+        boundaries: list[Boundary] = []
+        for char, start, end in zip(
+            alignment.characters, alignment.character_start_times_seconds, alignment.character_end_times_seconds
+        ):
+            if char.isspace():
+                boundaries.extend(self._close_word())
+            else:
+                if self.word_start is None:
+                    self.word_start = len(self.text)
+                    self.word_start_time = start
+                self.word_end_time = end
+            self.text += char
+        return boundaries
+
+    def close(self) -> list[Boundary]:
+        return self._close_word()
+
+
+def _parse_alignment(alignment: CharacterAlignmentResponseModel | None) -> Transcript | None:
+    if alignment is None:
+        return None
+
+    parser = _AlignmentParser()
+    boundaries = parser.feed(alignment) + parser.close()
+    return Transcript(text=parser.text, boundaries=boundaries)
+
+
 class ElevenLabsService(Service):
     def __init__(self, *, api_key: str | None = None) -> None:
-        if api_key is None:
-            api_key = os.getenv("ELEVEN_API_KEY")
-            if api_key is None:
-                raise ValueError("ElevenLabs API key is not provided")
+        self.client = _get_client(_get_api_key(api_key))
+
+    @property
+    def service_name(self) -> str:
+        return "ElevenLabs"
 
-        self.client = ElevenLabs(api_key=api_key)
+
+class AsyncElevenLabsService(Service):
+    def __init__(self, *, api_key: str | None = None) -> None:
+        self.client = AsyncElevenLabs(api_key=_get_api_key(api_key))
 
     @property
     def service_name(self) -> str:
@@ -29,18 +120,97 @@ class ElevenLabsService(Service):
 
 
 class ElevenLabsTTSService(TTSService, ElevenLabsService):
-    def __init__(self, voice: str, model: str = "eleven_v3", *, api_key: str | None = None, **kwargs) -> None:
+    fingerprint_attrs = ("voice", "model", "kwargs")
+    supports_streaming = True
+
+    def __init__(
+        self,
+        voice: str,
+        model: str = "eleven_v3",
+        *,
+        timestamps: bool = True,
+        api_key: str | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(api_key=api_key)
+        self.voice = voice
+        self.model = model
+        self.timestamps = timestamps
+        self.kwargs = kwargs
+
+    def tts(self, text: str, out_path: str | PathLike[str]) -> Transcript | None:
+        if not self.timestamps:
+            audio = self.client.text_to_speech.convert(
+                text=text, voice_id=self.voice, model_id=self.model, **self.kwargs
+            )
+            elevenlabs.save(audio, os.fspath(out_path))
+            return None
+
+        response = self.client.text_to_speech.convert_with_timestamps(
+            text=text, voice_id=self.voice, model_id=self.model, **self.kwargs
+        )
+        Path(out_path).write_bytes(base64.b64decode(response.audio_base_64))
+        return _parse_alignment(response.alignment)
+
+    def tts_stream(self, text: str) -> abc.Iterator[AudioChunk]:
+        if not self.timestamps:
+            for data in self.client.text_to_speech.stream(
+                text=text, voice_id=self.voice, model_id=self.model, **self.kwargs
+            ):
+                yield AudioChunk(data=data)
+            return
+
+        parser = _AlignmentParser()
+        for chunk in self.client.text_to_speech.stream_with_timestamps(
+            text=text, voice_id=self.voice, model_id=self.model, **self.kwargs
+        ):
+            yield AudioChunk(
+                data=base64.b64decode(chunk.audio_base_64) if chunk.audio_base_64 is not None else b"",
+                boundaries=parser.feed(chunk.alignment) if chunk.alignment is not None else [],
+            )
+        yield AudioChunk(data=b"", boundaries=parser.close())
+
+
+class AsyncElevenLabsTTSService(AsyncTTSService, AsyncElevenLabsService):
+    fingerprint_attrs = ("voice", "model", "kwargs")
+
+    def __init__(
+        self,
+        voice: str,
+        model: str = "eleven_v3",
+        *,
+        timestamps: bool = True,
+        api_key: str | None = None,
+        **kwargs,
+    ) -> None:
         super().__init__(api_key=api_key)
         self.voice = voice
         self.model = model
+        self.timestamps = timestamps
         self.kwargs = kwargs
 
-    def tts(self, text: str, out_path: str | PathLike[str]) -> None:
-        audio = self.client.text_to_speech.convert(text=text, voice_id=self.voice, model_id=self.model, **self.kwargs)
-        elevenlabs.save(audio, os.fspath(out_path))
+    async def tts(self, text: str, out_path: str | PathLike[str]) -> Transcript | None:
+        if not isinstance(out_path, Path):
+            out_path = Path(out_path)
+
+        if not self.timestamps:
+            audio = self.client.text_to_speech.convert(
+                text=text, voice_id=self.voice, model_id=self.model, **self.kwargs
+            )
+            data = b"".join([chunk async for chunk in audio])
+            await asyncio.to_thread(out_path.write_bytes, data)
+            return None
+
+        response = await self.client.text_to_speech.convert_with_timestamps(
+            text=text, voice_id=self.voice, model_id=self.model, **self.kwargs
+        )
+        await asyncio.to_thread(out_path.write_bytes, base64.b64decode(response.audio_base_64))
+        return _parse_alignment(response.alignment)
 
 
 class ElevenLabsSTTService(STTService, ElevenLabsService):
+    fingerprint_attrs = ("model", "language", "kwargs")
+
     def __init__(
         self, model: str = "scribe_v2", language: str | None = None, *, api_key: str | None = None, **kwargs
     ) -> None:
@@ -58,12 +228,31 @@ class ElevenLabsSTTService(STTService, ElevenLabsService):
                 file=f, model_id=self.model, language_code=self.language, timestamps_granularity="word", **self.kwargs
             )
 
-        boundaries: list[Boundary] = []
-        text_offset = 0
-        for word in response.words:
-            assert word.start is not None and word.end is not None
-            text_start = response.text.find(word.text, text_offset)
-            boundaries.append(Boundary(text=word.text, start=word.start, end=word.end, text_start=text_start))
-            text_offset = text_start + len(word.text)
-
-        return Transcript(text=response.text, boundaries=boundaries)
+        return _parse_transcription(response)
+
+
+class AsyncElevenLabsSTTService(AsyncSTTService, AsyncElevenLabsService):
+    fingerprint_attrs = ("model", "language", "kwargs")
+
+    def __init__(
+        self, model: str = "scribe_v2", language: str | None = None, *, api_key: str | None = None, **kwargs
+    ) -> None:
+        super().__init__(api_key=api_key)
+        self.model = model
+        self.language = language
+        self.kwargs = kwargs
+
+    async def stt(self, in_path: str | PathLike[str]) -> Transcript:
+        if not isinstance(in_path, Path):
+            in_path = Path(in_path)
+
+        data = await asyncio.to_thread(in_path.read_bytes)
+        response: SpeechToTextChunkResponseModel = await self.client.speech_to_text.convert(
+            file=(in_path.name, data),
+            model_id=self.model,
+            language_code=self.language,
+            timestamps_granularity="word",
+            **self.kwargs,
+        )
+
+        return _parse_transcription(response)
@@ -0,0 +1,118 @@
+"""faster-whisper services."""
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent import futures
+from os import PathLike
+
+from .base import AsyncSTTService, Boundary, Service, STTService, Transcript, find_word
+
+try:
+    from faster_whisper import WhisperModel
+    from faster_whisper.transcribe import Segment
+except ImportError:
+    raise ImportError("Please install faster-whisper with `pip install faster-whisper`")
+
+_load_lock = threading.Lock()
+
+
+@functools.cache
+def _load_model(model: str, device: str, compute_type: str, cpu_threads: int, num_workers: int) -> WhisperModel:
+    return WhisperModel(
+        model, device=device, compute_type=compute_type, cpu_threads=cpu_threads, num_workers=num_workers
+    )
+
+
+def _parse_transcription(segments: list[Segment]) -> Transcript:
+    text = "".join(segment.text for segment in segments)
+    word_boundaries: list[Boundary] = []
+    text_offset = 0
+    for segment in segments:
+        for word in segment.words or []:
+            text_start = find_word(text, word.word, text_offset)
+            word_boundaries.append(
+                Boundary(
+                    text=word.word,
+                    start=word.start,
+                    end=word.end,
+                    text_start=text_start,
+                )
+            )
+            text_offset = text_start + len(word.word)
+
+    return Transcript(text=text, boundaries=word_boundaries)
+
+
+class FasterWhisperService(Service):
+    @property
+    def service_name(self) -> str:
+        return "faster-whisper"
+
+
+class FasterWhisperSTTService(STTService, FasterWhisperService):
+    # CTranslate2 releases the GIL, so up to `num_workers` transcriptions run in parallel on the shared model.
+    fingerprint_attrs = ("model", "language", "compute_type", "kwargs")
+
+    def __init__(
+        self,
+        model: str = "base",
+        language: str | None = None,
+        *,
+        device: str = "cpu",
+        compute_type: str = "int8",
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        **kwargs,
+    ) -> None:
+        self.model = model
+        self.language = language
+        self.compute_type = compute_type
+        self.kwargs = kwargs
+        self.max_concurrency = num_workers
+        with _load_lock:
+            self.model_obj = _load_model(model, device, compute_type, cpu_threads, num_workers)
+
+    def stt(self, in_path: str | PathLike[str]) -> Transcript:
+        segments, _ = self.model_obj.transcribe(
+            os.fspath(in_path), language=self.language, word_timestamps=True, **self.kwargs
+        )
+        return _parse_transcription(list(segments))
+
+    def stt_many(self, in_paths: list[str | PathLike[str]]) -> list[Transcript]:
+        with futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            return list(pool.map(self.stt, in_paths))
+
+
+class AsyncFasterWhisperSTTService(AsyncSTTService, FasterWhisperService):
+    fingerprint_attrs = ("model", "language", "compute_type", "kwargs")
+
+    def __init__(
+        self,
+        model: str = "base",
+        language: str | None = None,
+        *,
+        device: str = "cpu",
+        compute_type: str = "int8",
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        **kwargs,
+    ) -> None:
+        self.model = model
+        self.language = language
+        self.compute_type = compute_type
+        self.kwargs = kwargs
+        self.max_concurrency = num_workers
+        self.sync_service = FasterWhisperSTTService(
+            model,
+            language,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers,
+            **kwargs,
+        )
+
+    async def stt(self, in_path: str | PathLike[str]) -> Transcript:
+        return await asyncio.to_thread(self.sync_service.stt, in_path)
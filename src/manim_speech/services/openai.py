@@ -1,28 +1,80 @@
 """OpenAI services."""
 
+import asyncio
+import functools
 import os
+from collections import abc
 from os import PathLike
 from pathlib import Path
 
-from .base import Boundary, Service, STTService, Transcript, TTSService
+from .base import (
+    AsyncSTTService,
+    AsyncTTSService,
+    AudioChunk,
+    Boundary,
+    Service,
+    STTService,
+    Transcript,
+    TTSService,
+    find_word,
+)
 
 try:
     import openai
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
     from openai.types.audio import TranscriptionVerbose
     from openai.types.audio.speech_create_params import VoiceID
 except ImportError:
     raise ImportError("Please install openai with `pip install openai`.")
 
 
+def _get_api_key(api_key: str | None) -> str:
+    if api_key is None:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if api_key is None:
+            raise ValueError("OpenAI API key is not provided")
+    return api_key
+
+
+@functools.cache
+def _get_client(api_key: str, base_url: str | None) -> OpenAI:
+    # Clients are shared by every service using the same credentials, so requests reuse pooled connections.
+    return OpenAI(api_key=api_key, base_url=base_url)
+
+
+def _parse_transcription(response: TranscriptionVerbose) -> Transcript:
+    boundaries: list[Boundary] = []
+    text_offset = 0
+    assert response.words is not None
+    for word in response.words:
+        text_start = find_word(response.text, word.word, text_offset)
+        boundaries.append(
+            Boundary(
+                text=word.word,
+                start=word.start,
+                end=word.end,
+                text_start=text_start,
+            )
+        )
+        text_offset = text_start + len(word.word)
+
+    return Transcript(text=response.text, boundaries=boundaries)
+
+
 class OpenAIService(Service):
     def __init__(self, *, api_key: str | None = None, base_url: str | None = None) -> None:
-        if api_key is None:
-            api_key = os.getenv("OPENAI_API_KEY")
-            if api_key is None:
-                raise ValueError("OpenAI API key is not provided")
+        self.base_url = base_url
+        self.client = _get_client(_get_api_key(api_key), base_url)
 
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+    @property
+    def service_name(self) -> str:
+        return "OpenAI"
+
+
+class AsyncOpenAIService(Service):
+    def __init__(self, *, api_key: str | None = None, base_url: str | None = None) -> None:
+        self.base_url = base_url
+        self.client = AsyncOpenAI(api_key=_get_api_key(api_key), base_url=base_url)
 
     @property
     def service_name(self) -> str:
@@ -30,6 +82,9 @@ class OpenAIService(Service):
 
 
 class OpenAITTSService(TTSService, OpenAIService):
+    fingerprint_attrs = ("voice", "model", "base_url", "kwargs")
+    supports_streaming = True
+
     def __init__(
         self,
         voice: str | VoiceID = "alloy",
@@ -50,8 +105,41 @@ class OpenAITTSService(TTSService, OpenAIService):
         ) as response:
             response.stream_to_file(out_path)
 
+    def tts_stream(self, text: str) -> abc.Iterator[AudioChunk]:
+        with self.client.audio.speech.with_streaming_response.create(
+            input=text, model=self.model, voice=self.voice, **self.kwargs
+        ) as response:
+            for data in response.iter_bytes():
+                yield AudioChunk(data=data)
+
+
+class AsyncOpenAITTSService(AsyncTTSService, AsyncOpenAIService):
+    fingerprint_attrs = ("voice", "model", "base_url", "kwargs")
+
+    def __init__(
+        self,
+        voice: str | VoiceID = "alloy",
+        model: str = "gpt-4o-mini-tts",
+        *,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(api_key=api_key, base_url=base_url)
+        self.voice = voice
+        self.model = model
+        self.kwargs = kwargs
+
+    async def tts(self, text: str, out_path: str | PathLike[str]) -> None:
+        async with self.client.audio.speech.with_streaming_response.create(
+            input=text, model=self.model, voice=self.voice, **self.kwargs
+        ) as response:
+            await response.stream_to_file(out_path)
+
 
 class OpenAISTTService(STTService, OpenAIService):
+    fingerprint_attrs = ("model", "language", "base_url", "kwargs")
+
     def __init__(
         self,
         model: str = "whisper-1",
@@ -80,19 +168,38 @@ class OpenAISTTService(STTService, OpenAIService):
                 **self.kwargs,
             )
 
-        boundaries: list[Boundary] = []
-        text_offset = 0
-        assert response.words is not None
-        for word in response.words:
-            text_start = response.text.find(word.word, text_offset)
-            boundaries.append(
-                Boundary(
-                    text=word.word,
-                    start=word.start,
-                    end=word.end,
-                    text_start=text_start,
-                )
-            )
-            text_offset = text_start + len(word.word)
+        return _parse_transcription(response)
+
+
+class AsyncOpenAISTTService(AsyncSTTService, AsyncOpenAIService):
+    fingerprint_attrs = ("model", "language", "base_url", "kwargs")
+
+    def __init__(
+        self,
+        model: str = "whisper-1",
+        language: str | None = None,
+        *,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(api_key=api_key, base_url=base_url)
+        self.model = model
+        self.language = language
+        self.kwargs = kwargs
+
+    async def stt(self, in_path: str | PathLike[str]) -> Transcript:
+        if not isinstance(in_path, Path):
+            in_path = Path(in_path)
 
-        return Transcript(text=response.text, boundaries=boundaries)
+        data = await asyncio.to_thread(in_path.read_bytes)
+        response: TranscriptionVerbose = await self.client.audio.transcriptions.create(
+            file=(in_path.name, data),
+            model=self.model,
+            language=self.language if self.language is not None else openai.omit,
+            response_format="verbose_json",
+            timestamp_granularities=["word"],
+            **self.kwargs,
+        )
+
+        return _parse_transcription(response)
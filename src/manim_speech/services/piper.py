@@ -0,0 +1,108 @@
+"""Piper services."""
+
+import functools
+import re
+import threading
+from collections import abc
+from os import PathLike
+from pathlib import Path
+
+import numpy as np
+
+from .. import audio
+from .base import Boundary, Service, Transcript, TTSService
+
+try:
+    from piper import AudioChunk, PiperVoice, SynthesisConfig
+    from piper.download_voices import download_voice
+except ImportError:
+    raise ImportError("Please install piper-tts with `pip install piper-tts`")
+
+_load_lock = threading.Lock()
+
+
+@functools.cache
+def _load_voice(model: str, download_dir: Path, use_cuda: bool) -> tuple[PiperVoice, threading.RLock]:
+    model_path = Path(model)
+    if model_path.suffix != ".onnx":
+        model_path = download_dir / f"{model}.onnx"
+        if not model_path.exists():
+            download_dir.mkdir(parents=True, exist_ok=True)
+            download_voice(model, download_dir)
+    return PiperVoice.load(model_path, use_cuda=use_cuda, include_alignments=True), threading.RLock()
+
+
+def _get_boundaries(text: str, chunks: list[AudioChunk]) -> list[Boundary] | None:
+    words = list(re.finditer(r"\S+", text))
+    word_times: list[tuple[float, float]] = []
+    offset = 0.0
+    for chunk in chunks:
+        if chunk.phoneme_alignments is None:
+            word_times = []
+            break
+        time = offset
+        word_start: float | None = None
+        for alignment in chunk.phoneme_alignments:
+            if alignment.phoneme in (" ", "^", "$"):
+                if word_start is not None:
+                    word_times.append((word_start, time))
+                    word_start = None
+            elif word_start is None:
+                word_start = time
+            time += alignment.num_samples / chunk.sample_rate
+        if word_start is not None:
+            word_times.append((word_start, time))
+        offset += len(chunk.audio_float_array) / chunk.sample_rate
+
+    if not words or len(word_times) != len(words):
+        # The model has no alignments, or espeak split the text into words differently (e.g. numbers).
+        return None
+    return [
+        Boundary(text=word.group(), start=start, end=end, text_start=word.start())
+        for word, (start, end) in zip(words, word_times)
+    ]
+
+
+class PiperService(Service):
+    @property
+    def service_name(self) -> str:
+        return "Piper"
+
+
+class PiperTTSService(TTSService, PiperService):
+    fingerprint_attrs = ("model", "kwargs")
+    max_concurrency = 1
+
+    def __init__(
+        self,
+        model: str = "en_US-lessac-medium",
+        *,
+        download_dir: str | PathLike[str] | None = None,
+        use_cuda: bool = False,
+        **kwargs,
+    ) -> None:
+        self.model = model
+        self.kwargs = kwargs
+        self.syn_config = SynthesisConfig(**kwargs)
+        with _load_lock:
+            self.voice, self.lock = _load_voice(
+                model, Path(download_dir) if download_dir is not None else Path.home() / ".cache" / "piper", use_cuda
+            )
+
+    def synthesize(self, text: str) -> tuple[np.ndarray, int, Transcript | None]:
+        with self.lock:
+            chunks = list(self.voice.synthesize(text, self.syn_config, include_alignments=True))
+        sample_rate = chunks[0].sample_rate if chunks else self.voice.config.sample_rate
+        samples = np.concatenate([chunk.audio_float_array for chunk in chunks]) if chunks else np.zeros(0, np.float32)
+        boundaries = _get_boundaries(text, chunks)
+        return samples, sample_rate, Transcript(text=text, boundaries=boundaries) if boundaries is not None else None
+
+    def tts(self, text: str, out_path: str | PathLike[str]) -> Transcript | None:
+        samples, sample_rate, transcript = self.synthesize(text)
+        audio.write_mp3(out_path, samples, sample_rate)
+        return transcript
+
+    def tts_many(self, requests: abc.Iterable[tuple[str, str | PathLike[str]]]) -> None:
+        with self.lock:
+            for text, out_path in requests:
+                self.tts(text, out_path)
@@ -0,0 +1,297 @@
+"""Rate limiting, retry and concurrency middleware for services."""
+
+import asyncio
+import functools
+import random
+import threading
+import time
+import weakref
+from collections import abc
+from os import PathLike
+from typing import Any, TypeVar
+
+from .base import (
+    AsyncSTTService,
+    AsyncTranslationService,
+    AsyncTTSService,
+    AudioChunk,
+    Service,
+    STTService,
+    Transcript,
+    TranslationService,
+    TTSService,
+)
+
+TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (ConnectionError, TimeoutError)
+RETRY_STATUS_CODES = frozenset({408, 409, 425, 429, 500, 502, 503, 504})
+
+T = TypeVar("T")
+
+
+def _get_status(error: BaseException) -> int | None:
+    for attr in ("status_code", "http_status_code", "status", "code"):
+        status = getattr(error, attr, None)
+        if isinstance(status, int):
+            return status
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _get_retry_after(error: BaseException) -> float | None:
+    headers = getattr(error, "headers", None) or getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        return float(headers.get("retry-after") or "")
+    except ValueError:
+        return None
+
+
+@functools.cache
+def _get_transient_errors() -> tuple[type[BaseException], ...]:
+    # httpx is only imported when a request fails, and only if it is installed.
+    try:
+        import httpx
+    except ImportError:
+        return TRANSIENT_ERRORS
+    return (*TRANSIENT_ERRORS, httpx.TransportError)
+
+
+def is_retryable(error: BaseException) -> bool:
+    # SDKs wrap transport errors in their own exception types, so the whole chain of causes is checked.
+    transient_errors = _get_transient_errors()
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, transient_errors) or getattr(current, "should_retry", False):
+            return True
+        if _get_status(current) in RETRY_STATUS_CODES:
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class TokenBucket:
+    def __init__(self, rate_per_minute: float, capacity: float | None = None) -> None:
+        self.rate = rate_per_minute / 60
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        # Tokens are taken immediately and may go negative, so callers are served in order and a request larger than
+        # the capacity only waits for the deficit to refill. Returns the time to wait before sending.
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            return max(0.0, -self.tokens / self.rate)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        *,
+        requests_per_minute: float | None = None,
+        chars_per_minute: float | None = None,
+        max_concurrency: int | None = None,
+        max_retries: int = 5,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute is not None else None
+        self.chars = TokenBucket(chars_per_minute) if chars_per_minute is not None else None
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.semaphore = threading.BoundedSemaphore(max_concurrency) if max_concurrency is not None else None
+        self.async_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _get_delay(self, chars: int) -> float:
+        delay = self.requests.reserve(1) if self.requests is not None else 0.0
+        if self.chars is not None and chars:
+            delay = max(delay, self.chars.reserve(chars))
+        return delay
+
+    def _get_backoff(self, error: BaseException, attempt: int, name: str) -> float | None:
+        if attempt >= self.max_retries or not is_retryable(error):
+            return None
+        # Full jitter keeps parallel workers that failed together from retrying together.
+        delay = random.uniform(0, min(self.max_backoff, self.initial_backoff * 2**attempt))
+        retry_after = _get_retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        # Manim is imported here, so wrapping a service does not load it.
+        import manim
+
+        manim.logger.warning(
+            f"{name} request failed ({error!r}). Retrying in {delay:.1f}s ({attempt + 1}/{self.max_retries})..."
+        )
+        return delay
+
+    def _get_async_semaphore(self) -> asyncio.Semaphore | None:
+        if self.max_concurrency is None:
+            return None
+        loop = asyncio.get_running_loop()
+        if loop not in self.async_semaphores:
+            self.async_semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self.async_semaphores[loop]
+
+    def call(self, name: str, func: abc.Callable[..., T], *args: Any, chars: int = 0) -> T:
+        attempt = 0
+        while True:
+            time.sleep(self._get_delay(chars))
+            try:
+                if self.semaphore is None:
+                    return func(*args)
+                with self.semaphore:
+                    return func(*args)
+            except Exception as e:
+                if (delay := self._get_backoff(e, attempt, name)) is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+
+    async def call_async(self, name: str, func: abc.Callable[..., abc.Awaitable[T]], *args: Any, chars: int = 0) -> T:
+        semaphore = self._get_async_semaphore()
+        attempt = 0
+        while True:
+            await asyncio.sleep(self._get_delay(chars))
+            try:
+                if semaphore is None:
+                    return await func(*args)
+                async with semaphore:
+                    return await func(*args)
+            except Exception as e:
+                if (delay := self._get_backoff(e, attempt, name)) is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+
+
+class RateLimitedService(Service):
+    # Wrappers report the wrapped service's name and fingerprint, so cached voiceovers are shared with it.
+    def __init__(self, service: Any, limiter: RateLimiter) -> None:
+        self.service = service
+        self.limiter = limiter
+        self.max_concurrency = limiter.max_concurrency or service.max_concurrency
+
+    @property
+    def service_name(self) -> str:
+        return self.service.service_name
+
+    @property
+    def fingerprint(self) -> str:
+        return self.service.fingerprint
+
+
+class RateLimitedTTSService(RateLimitedService, TTSService):
+    def __init__(self, service: TTSService, limiter: RateLimiter) -> None:
+        super().__init__(service, limiter)
+        self.supports_streaming = service.supports_streaming
+
+    def tts(self, text: str, out_path: str | PathLike[str]) -> Transcript | None:
+        return self.limiter.call(self.service_name, self.service.tts, text, out_path, chars=len(text))
+
+    def tts_stream(self, text: str) -> abc.Iterator[AudioChunk]:
+        # A stream cannot be retried once chunks have been yielded, so only opening it is rate limited and retried.
+        # Each attempt opens a new stream, as a generator that raised is finished.
+        def open_stream() -> tuple[AudioChunk | None, abc.Iterator[AudioChunk]]:
+            stream = iter(self.service.tts_stream(text))
+            return next(stream, None), stream
+
+        first, stream = self.limiter.call(self.service_name, open_stream, chars=len(text))
+        if first is not None:
+            yield first
+            yield from stream
+
+
+class AsyncRateLimitedTTSService(RateLimitedService, AsyncTTSService):
+    def __init__(self, service: AsyncTTSService, limiter: RateLimiter) -> None:
+        super().__init__(service, limiter)
+
+    async def tts(self, text: str, out_path: str | PathLike[str]) -> Transcript | None:
+        return await self.limiter.call_async(self.service_name, self.service.tts, text, out_path, chars=len(text))
+
+
+class RateLimitedSTTService(RateLimitedService, STTService):
+    def __init__(self, service: STTService, limiter: RateLimiter) -> None:
+        super().__init__(service, limiter)
+
+    def stt(self, in_path: str | PathLike[str]) -> Transcript:
+        return self.limiter.call(self.service_name, self.service.stt, in_path)
+
+
+class AsyncRateLimitedSTTService(RateLimitedService, AsyncSTTService):
+    def __init__(self, service: AsyncSTTService, limiter: RateLimiter) -> None:
+        super().__init__(service, limiter)
+
+    async def stt(self, in_path: str | PathLike[str]) -> Transcript:
+        return await self.limiter.call_async(self.service_name, self.service.stt, in_path)
+
+
+class RateLimitedTranslationService(RateLimitedService, TranslationService):
+    def __init__(self, service: TranslationService, limiter: RateLimiter) -> None:
+        super().__init__(service, limiter)
+        self.max_batch_size = service.max_batch_size
+        self.max_batch_bytes = service.max_batch_bytes
+
+    def translate(self, text: str, src_lang: str, dst_lang: str) -> str:
+        return self.limiter.call(self.service_name, self.service.translate, text, src_lang, dst_lang, chars=len(text))
+
+    def translate_batch(self, texts: list[str], src_lang: str, dst_lang: str) -> list[str]:
+        return self.limiter.call(
+            self.service_name,
+            self.service.translate_batch,
+            texts,
+            src_lang,
+            dst_lang,
+            chars=sum(len(text) for text in texts),
+        )
+
+
+class AsyncRateLimitedTranslationService(RateLimitedService, AsyncTranslationService):
+    def __init__(self, service: AsyncTranslationService, limiter: RateLimiter) -> None:
+        super().__init__(service, limiter)
+        self.max_batch_size = service.max_batch_size
+        self.max_batch_bytes = service.max_batch_bytes
+
+    async def translate(self, text: str, src_lang: str, dst_lang: str) -> str:
+        return await self.limiter.call_async(
+            self.service_name, self.service.translate, text, src_lang, dst_lang, chars=len(text)
+        )
+
+    async def translate_batch(self, texts: list[str], src_lang: str, dst_lang: str) -> list[str]:
+        return await self.limiter.call_async(
+            self.service_name,
+            self.service.translate_batch,
+            texts,
+            src_lang,
+            dst_lang,
+            chars=sum(len(text) for text in texts),
+        )
+
+
+_WRAPPERS: list[tuple[type[Service], type[RateLimitedService]]] = [
+    (TTSService, RateLimitedTTSService),
+    (AsyncTTSService, AsyncRateLimitedTTSService),
+    (STTService, RateLimitedSTTService),
+    (AsyncSTTService, AsyncRateLimitedSTTService),
+    (TranslationService, RateLimitedTranslationService),
+    (AsyncTranslationService, AsyncRateLimitedTranslationService),
+]
+
+
+def rate_limited(service: Any, limiter: RateLimiter | None = None, **kwargs: Any) -> Any:
+    if limiter is None:
+        limiter = RateLimiter(**kwargs)
+    for service_type, wrapper in _WRAPPERS:
+        if isinstance(service, service_type):
+            return wrapper(service, limiter)
+    raise ValueError(f"Cannot rate limit {type(service).__name__}, which is not a TTS, STT or translation service")
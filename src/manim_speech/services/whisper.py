@@ -1,15 +1,46 @@
 """Whisper services."""
 
+import asyncio
+import functools
 import os
+import threading
 from os import PathLike
 
-from .base import Boundary, Service, STTService, Transcript
+from .base import AsyncSTTService, Boundary, Service, STTService, Transcript, find_word
 
 try:
+    import torch
     import whisper
 except ImportError:
     raise ImportError("Please install whisper with `pip install whisper`")
 
+_load_lock = threading.Lock()
+
+
+@functools.cache
+def _load_model(model: str, device: str | None) -> tuple[whisper.Whisper, threading.RLock]:
+    # Transcription installs hooks on the model, so calls on a shared model must not overlap.
+    return whisper.load_model(model, device=device), threading.RLock()
+
+
+def _parse_transcription(result: dict) -> Transcript:
+    word_boundaries: list[Boundary] = []
+    text_offset = 0
+    for segment in result["segments"]:
+        for word in segment["words"]:
+            text_start = find_word(result["text"], word["word"], text_offset)
+            word_boundaries.append(
+                Boundary(
+                    text=word["word"],
+                    start=word["start"],
+                    end=word["end"],
+                    text_start=text_start,
+                )
+            )
+            text_offset = text_start + len(word["word"])
+
+    return Transcript(text=result["text"], boundaries=word_boundaries)
+
 
 class WhisperService(Service):
     @property
@@ -18,29 +49,57 @@ class WhisperService(Service):
 
 
 class WhisperSTTService(STTService, WhisperService):
+    fingerprint_attrs = ("model", "language", "kwargs")
+    max_concurrency = 1
+
     def __init__(
-        self, model: str = "base", language: str | None = None, *, device: str | None = None, **kwargs
+        self,
+        model: str = "base",
+        language: str | None = None,
+        *,
+        device: str | None = None,
+        num_threads: int | None = None,
+        **kwargs,
     ) -> None:
-        self.model_obj = whisper.load_model(model, device=device)
+        self.model = model
+        with _load_lock:
+            self.model_obj, self.lock = _load_model(model, device)
         self.language = language
         self.kwargs = kwargs
+        if num_threads is not None:
+            torch.set_num_threads(num_threads)
 
     def stt(self, in_path: str | PathLike[str]) -> Transcript:
-        transcript = self.model_obj.transcribe(os.fspath(in_path), word_timestamps=True, **self.kwargs)
-
-        word_boundaries: list[Boundary] = []
-        text_offset = 0
-        for segment in transcript["segments"]:
-            for word in segment["words"]:
-                text_start: int = transcript["text"].find(word["word"], text_offset)
-                word_boundaries.append(
-                    Boundary(
-                        text=word["word"],
-                        start=word["start"],
-                        end=word["end"],
-                        text_start=text_start,
-                    )
-                )
-                text_offset = text_start + len(word["word"])
+        with self.lock:
+            result = self.model_obj.transcribe(os.fspath(in_path), word_timestamps=True, **self.kwargs)
+        return _parse_transcription(result)
+
+    def stt_many(self, in_paths: list[str | PathLike[str]]) -> list[Transcript]:
+        with self.lock:
+            return [self.stt(in_path) for in_path in in_paths]
+
+
+class AsyncWhisperSTTService(AsyncSTTService, WhisperService):
+    # Whisper runs locally, so transcriptions are run one at a time in the default executor.
+    fingerprint_attrs = ("model", "language", "kwargs")
+    max_concurrency = 1
+
+    def __init__(
+        self,
+        model: str = "base",
+        language: str | None = None,
+        *,
+        device: str | None = None,
+        num_threads: int | None = None,
+        **kwargs,
+    ) -> None:
+        self.model = model
+        self.language = language
+        self.kwargs = kwargs
+        self.sync_service = WhisperSTTService(model, language, device=device, num_threads=num_threads, **kwargs)
+
+    async def stt(self, in_path: str | PathLike[str]) -> Transcript:
+        return await asyncio.to_thread(self.sync_service.stt, in_path)
 
-        return Transcript(text=transcript["text"], boundaries=word_boundaries)
+    async def stt_many(self, in_paths: list[str | PathLike[str]]) -> list[Transcript]:
+        return await asyncio.to_thread(self.sync_service.stt_many, in_paths)
@@ -0,0 +1,140 @@
+"""Timing spans and counters for Manim Speech."""
+
+import contextlib
+import threading
+import time
+from collections import abc
+
+from pydantic import BaseModel
+
+Attributes = dict[str, str | float | bool]
+
+
+class Span(BaseModel):
+    name: str
+    start: float
+    duration: float
+    attributes: Attributes = {}
+    error: str | None = None
+
+
+class Hook:
+    def on_span(self, span: Span) -> None:
+        return None
+
+    def on_count(self, name: str, value: float, attributes: Attributes) -> None:
+        return None
+
+
+# Replaced rather than mutated, so spans ending in other threads iterate over a consistent list without locking.
+_hooks: tuple[Hook, ...] = ()
+_hooks_lock = threading.Lock()
+
+
+def add_hook(hook: Hook) -> None:
+    global _hooks
+    with _hooks_lock:
+        _hooks = (*_hooks, hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    global _hooks
+    with _hooks_lock:
+        _hooks = tuple(other for other in _hooks if other is not hook)
+
+
+@contextlib.contextmanager
+def span(name: str, **attributes: str | float | bool) -> abc.Generator[Attributes, None, None]:
+    # The body may add attributes known only at the end (e.g. the size of a download) to the yielded dict.
+    hooks = _hooks
+    if not hooks:
+        yield attributes
+        return
+    start = time.time()
+    perf_start = time.perf_counter()
+    error: str | None = None
+    try:
+        yield attributes
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        record = Span(
+            name=name, start=start, duration=time.perf_counter() - perf_start, attributes=attributes, error=error
+        )
+        for hook in hooks:
+            hook.on_span(record)
+
+
+def count(name: str, value: float = 1, **attributes: str | float | bool) -> None:
+    for hook in _hooks:
+        hook.on_count(name, value, attributes)
+
+
+class _Stage:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total = 0.0
+        self.longest = 0.0
+        self.errors = 0
+
+
+class Report(Hook):
+    # Aggregates spans and counters per stage and provider, e.g. to find the slowest provider of a scene.
+    def __init__(self) -> None:
+        self.stages: dict[tuple[str, str], _Stage] = {}
+        self.counters: dict[tuple[str, str], float] = {}
+        self.lock = threading.Lock()
+
+    def on_span(self, span: Span) -> None:
+        key = (span.name, str(span.attributes.get("provider", "")))
+        with self.lock:
+            stage = self.stages.setdefault(key, _Stage())
+            stage.calls += 1
+            stage.total += span.duration
+            stage.longest = max(stage.longest, span.duration)
+            stage.errors += span.error is not None
+
+    def on_count(self, name: str, value: float, attributes: Attributes) -> None:
+        key = (name, str(attributes.get("provider", "")))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def __bool__(self) -> bool:
+        return bool(self.stages or self.counters)
+
+    def format(self) -> str:
+        with self.lock:
+            rows = [
+                [
+                    name,
+                    provider,
+                    str(stage.calls),
+                    f"{stage.total:.3f}",
+                    f"{stage.total / stage.calls * 1000:.1f}",
+                    f"{stage.longest * 1000:.1f}",
+                    str(stage.errors),
+                ]
+                for (name, provider), stage in sorted(self.stages.items(), key=lambda item: -item[1].total)
+            ]
+            counters = [[name, provider, f"{value:g}"] for (name, provider), value in sorted(self.counters.items())]
+        return "\n\n".join(
+            _format_table(header, table)
+            for header, table in [
+                (["Stage", "Provider", "Calls", "Total (s)", "Mean (ms)", "Max (ms)", "Errors"], rows),
+                (["Counter", "Provider", "Value"], counters),
+            ]
+            if table
+        )
+
+
+def _format_table(header: list[str], rows: list[list[str]]) -> str:
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    lines = [header, ["-" * width for width in widths], *rows]
+    # Names are left-aligned and numbers right-aligned.
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if i < 2 else cell.rjust(width) for i, (cell, width) in enumerate(zip(line, widths))
+        )
+        for line in lines
+    )
@@ -1,27 +1,102 @@
 """Text translation functions for Manim Speech."""
 
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
 import os
+import sqlite3
 import subprocess
 import sys
+from collections import abc
+from concurrent import futures
 from os import PathLike
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from . import audio, backends, services, telemetry, voiceover
+
+if TYPE_CHECKING:
+    import polib
+
+logger = logging.getLogger("manim")
+
+LANGUAGE_ENV_VAR = "MANIM_SPEECH_LANGUAGE"
+MEMORY_ENV_VAR = "MANIM_SPEECH_TRANSLATION_MEMORY"
+
+# SQLite limits the number of parameters of a statement, so bulk lookups are split into batches.
+LOOKUP_BATCH_SIZE = 500
 
-import manim
-import polib
 
-from . import services
+def get_memory_path() -> Path:
+    if MEMORY_ENV_VAR in os.environ:
+        return Path(os.environ[MEMORY_ENV_VAR])
+    # The memory lives in the user's cache rather than the media directory so that it is shared across projects.
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "manim_speech" / "translations.sqlite3"
+
+
+class TranslationMemory:
+    def __init__(self, path: str | PathLike[str] | None = None) -> None:
+        self.path = Path(path) if path is not None else get_memory_path()
+
+    @contextlib.contextmanager
+    def _connect(self) -> abc.Generator[sqlite3.Connection, None, None]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.closing(sqlite3.connect(self.path, timeout=30.0)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations "
+                "(text TEXT NOT NULL, src_lang TEXT NOT NULL, dst_lang TEXT NOT NULL, provider TEXT NOT NULL, "
+                "translation TEXT NOT NULL, PRIMARY KEY (text, src_lang, dst_lang, provider))"
+            )
+            yield conn
+
+    def lookup(self, texts: abc.Iterable[str], src_lang: str, dst_lang: str, provider: str) -> dict[str, str]:
+        texts = list(dict.fromkeys(texts))
+        found: dict[str, str] = {}
+        with self._connect() as conn:
+            for i in range(0, len(texts), LOOKUP_BATCH_SIZE):
+                batch = texts[i : i + LOOKUP_BATCH_SIZE]
+                rows = conn.execute(
+                    "SELECT text, translation FROM translations WHERE src_lang = ? AND dst_lang = ? AND provider = ? "
+                    f"AND text IN ({', '.join('?' * len(batch))})",
+                    (src_lang, dst_lang, provider, *batch),
+                )
+                found.update(rows)
+        return found
+
+    def insert(self, translations: abc.Mapping[str, str], src_lang: str, dst_lang: str, provider: str) -> None:
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO translations (text, src_lang, dst_lang, provider, translation) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(text, src_lang, dst_lang, provider, translation) for text, translation in translations.items()],
+            )
+
+    def import_po_file(self, path: str | PathLike[str], src_lang: str, dst_lang: str, provider: str) -> int:
+        import polib
+
+        pofile = polib.pofile(os.fspath(path))
+        translations = {entry.msgid: entry.msgstr for entry in pofile.translated_entries() if entry.msgstr}
+        self.insert(translations, src_lang, dst_lang, provider)
+        return len(translations)
 
 
 def init_translation_env(file: str | PathLike[str], domain: str) -> None:
     if not Path("locales").exists():
         Path("locales").mkdir()
+    pot_path = Path("locales") / f"{domain}.pot"
+    if pot_path.exists() and pot_path.stat().st_mtime >= Path(file).stat().st_mtime:
+        logger.info(f"Translation template {pot_path} is up to date.")
+        return
     result = subprocess.run(
         [
             "xgettext",
             "-d",
             domain,
             "-o",
-            str(Path("locales") / f"{domain}.pot"),
+            str(pot_path),
             os.fspath(file),
         ],
         check=False,
@@ -30,35 +105,258 @@ def init_translation_env(file: str | PathLike[str], domain: str) -> None:
         raise RuntimeError(f"xgettext failed with return code {result.returncode}")
 
 
+def _get_target_path(domain: str, target_lang: str) -> Path:
+    target_path = Path("locales") / target_lang / "LC_MESSAGES" / f"{domain}"
+    if not target_path.parent.exists():
+        target_path.parent.mkdir(parents=True)
+    return target_path
+
+
+def _load_template(domain: str) -> polib.POFile:
+    # polib is only needed when translation files are read, not by renders using compiled translations.
+    import polib
+
+    pofile = polib.pofile(str(Path("locales") / f"{domain}.pot"))
+    pofile.metadata["Content-Type"] = "text/plain; charset=UTF-8"
+    return pofile
+
+
+def _load_po_file(domain: str, target_path: Path) -> tuple[polib.POFile, bool]:
+    template = _load_template(domain)
+    if not target_path.with_suffix(".po").exists():
+        return template, True
+    logger.info(f"Translation file {target_path.with_suffix('.po')} found. Merging new messages...")
+    import polib
+
+    pofile = polib.pofile(str(target_path.with_suffix(".po")))
+    pofile.merge(template)
+    return pofile, False
+
+
+def _batch_entries(entries: list[polib.POEntry], max_size: int, max_bytes: int) -> abc.Iterator[list[polib.POEntry]]:
+    batch: list[polib.POEntry] = []
+    batch_bytes = 0
+    for entry in entries:
+        entry_bytes = len(entry.msgid.encode())
+        if batch and (len(batch) >= max_size or batch_bytes + entry_bytes > max_bytes):
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(entry)
+        batch_bytes += entry_bytes
+    if batch:
+        yield batch
+
+
+def _recall_entries(
+    entries: list[polib.POEntry], memory: TranslationMemory | None, src_lang: str, dst_lang: str, provider: str
+) -> list[polib.POEntry]:
+    # Fills in messages the provider has translated before, in any domain or project, and returns the rest.
+    if memory is None or not entries:
+        return entries
+    found = memory.lookup((entry.msgid for entry in entries), src_lang, dst_lang, provider)
+    for entry in entries:
+        if entry.msgid in found:
+            entry.msgstr = found[entry.msgid]
+    if found:
+        telemetry.count("translation.memory.hit", len(found))
+        logger.info(f"Found {len(found)} messages in the translation memory.")
+    return [entry for entry in entries if entry.msgid not in found]
+
+
+def _memorize_entries(
+    entries: list[polib.POEntry], memory: TranslationMemory | None, src_lang: str, dst_lang: str, provider: str
+) -> None:
+    if memory is not None and entries:
+        memory.insert({entry.msgid: entry.msgstr for entry in entries}, src_lang, dst_lang, provider)
+
+
+def _translate_span(
+    service: services.TranslationService | services.AsyncTranslationService, batch: list[polib.POEntry]
+) -> contextlib.AbstractContextManager[telemetry.Attributes]:
+    characters = sum(len(entry.msgid) for entry in batch)
+    telemetry.count("translation.characters", characters, provider=service.service_name)
+    return telemetry.span("translate", provider=service.service_name, messages=len(batch), characters=characters)
+
+
+def _translate_batch(
+    batch: list[polib.POEntry],
+    src_lang: str,
+    dst_lang: str,
+    service: services.TranslationService,
+    memory: TranslationMemory | None,
+) -> None:
+    with _translate_span(service, batch):
+        translations = service.translate_batch([entry.msgid for entry in batch], src_lang, dst_lang)
+    for entry, translation in zip(batch, translations, strict=True):
+        entry.msgstr = translation
+    _memorize_entries(batch, memory, src_lang, dst_lang, service.fingerprint)
+
+
+def _save_po_file(pofile: polib.POFile, target_path: Path, is_new: bool, has_service: bool) -> None:
+    pofile.save(str(target_path.with_suffix(".po")))
+    if not has_service:
+        if is_new:
+            import manim
+
+            manim.console.print(
+                f"An empty translation file has been created at {target_path.with_suffix('.po')}. Please fill it in and then rerun `manim`."
+            )
+            sys.exit(1)
+        untranslated = len(pofile.untranslated_entries())
+        if untranslated > 0:
+            logger.warning(f"{untranslated} messages in {target_path.with_suffix('.po')} are untranslated.")
+    pofile.save_as_mofile(str(target_path.with_suffix(".mo")))
+
+
 def translate_po_file(
     domain: str,
     src_lang: str,
     target_lang: str,
     *,
     service: services.TranslationService | None = None,
+    memory: TranslationMemory | None = None,
 ) -> None:
-    src_path = Path("locales") / f"{domain}.pot"
-    target_path = Path("locales") / target_lang / "LC_MESSAGES" / f"{domain}"
-    if not target_path.parent.exists():
-        target_path.parent.mkdir(parents=True)
-    manim.logger.info(f"Translating to {target_lang}...")
-    if not target_path.with_suffix(".po").exists():
-        pofile = polib.pofile(str(src_path))
-        pofile.metadata["Content-Type"] = "text/plain; charset=UTF-8"
-        if service is not None:
-            manim.logger.info(f"Using {service.service_name} translation service.")
-            for entry in pofile.untranslated_entries():
-                translation = service.translate(entry.msgid, src_lang, target_lang)
+    target_path = _get_target_path(domain, target_lang)
+    logger.info(f"Translating to {target_lang}...")
+    pofile, is_new = _load_po_file(domain, target_path)
+    entries = pofile.untranslated_entries()
+    if service is not None:
+        entries = _recall_entries(entries, memory, src_lang, target_lang, service.fingerprint)
+        logger.info(f"Using {service.service_name} translation service for {len(entries)} messages.")
+        for batch in _batch_entries(entries, service.max_batch_size, service.max_batch_bytes):
+            _translate_batch(batch, src_lang, target_lang, service, memory)
+    else:
+        logger.info("No translation service specified.")
+    _save_po_file(pofile, target_path, is_new, service is not None)
+
+
+async def translate_po_file_async(
+    domain: str,
+    src_lang: str,
+    target_lang: str,
+    *,
+    service: services.AsyncTranslationService | None = None,
+    memory: TranslationMemory | None = None,
+) -> None:
+    target_path = _get_target_path(domain, target_lang)
+    logger.info(f"Translating to {target_lang}...")
+    pofile, is_new = _load_po_file(domain, target_path)
+    entries = pofile.untranslated_entries()
+    if service is not None:
+        entries = _recall_entries(entries, memory, src_lang, target_lang, service.fingerprint)
+        logger.info(f"Using {service.service_name} translation service for {len(entries)} messages.")
+        semaphore = asyncio.Semaphore(service.max_concurrency)
+
+        async def translate_batch(batch: list[polib.POEntry]) -> None:
+            async with semaphore:
+                with _translate_span(service, batch):
+                    translations = await service.translate_batch(
+                        [entry.msgid for entry in batch], src_lang, target_lang
+                    )
+            for entry, translation in zip(batch, translations, strict=True):
                 entry.msgstr = translation
-        else:
-            manim.logger.info("No translation service specified.")
-        pofile.save(str(target_path.with_suffix(".po")))
-        if service is None:
-            manim.console.print(
-                f"An empty translation file has been created at {target_path.with_suffix('.po')}. Please fill it in and then rerun `manim`."
+
+        await asyncio.gather(
+            *(
+                translate_batch(batch)
+                for batch in _batch_entries(entries, service.max_batch_size, service.max_batch_bytes)
             )
-            sys.exit(1)
+        )
+        _memorize_entries(entries, memory, src_lang, target_lang, service.fingerprint)
     else:
-        manim.logger.info(f"Translation file for {target_lang} found.")
-        pofile = polib.pofile(str(target_path.with_suffix(".po")))
-    pofile.save_as_mofile(str(target_path.with_suffix(".mo")))
+        logger.info("No translation service specified.")
+    _save_po_file(pofile, target_path, is_new, service is not None)
+
+
+def _check_bookmarks(entry: polib.POEntry, dst_lang: str) -> None:
+    if sorted(voiceover.BOOKMARK_PATTERN.findall(entry.msgid)) != sorted(
+        voiceover.BOOKMARK_PATTERN.findall(entry.msgstr)
+    ):
+        logger.warning(f'Bookmarks were not preserved in the {dst_lang} translation of "{entry.msgid}".')
+
+
+def translate_texts(
+    texts: abc.Sequence[str],
+    src_lang: str,
+    dst_lang: str,
+    service: services.TranslationService,
+    *,
+    memory: TranslationMemory | None = None,
+) -> list[str]:
+    import polib
+
+    entries = [polib.POEntry(msgid=text) for text in dict.fromkeys(texts)]
+    for batch in _batch_entries(
+        _recall_entries(entries, memory, src_lang, dst_lang, service.fingerprint),
+        service.max_batch_size,
+        service.max_batch_bytes,
+    ):
+        _translate_batch(batch, src_lang, dst_lang, service, memory)
+    for entry in entries:
+        _check_bookmarks(entry, dst_lang)
+    translations = {entry.msgid: entry.msgstr for entry in entries}
+    return [translations[text] for text in texts]
+
+
+def prefetch_voiceovers(
+    texts: abc.Sequence[str],
+    src_lang: str,
+    dst_langs: abc.Sequence[str],
+    service: services.TranslationService,
+    tts_service: services.TTSService,
+    stt_service: services.STTService | None = None,
+    *,
+    memory: TranslationMemory | None = None,
+    cache_dir: str | PathLike[str] | None = None,
+    backend: backends.CacheBackend | None = None,
+    chunk_size: int | None = None,
+    post_processing: audio.PostProcessing | None = None,
+    batch_stt: bool = False,
+) -> dict[str, list[str]]:
+    # Each translated batch is queued for synthesis as soon as it arrives, so translation, synthesis and transcription
+    # of all languages overlap.
+    import polib
+
+    entries = {dst_lang: [polib.POEntry(msgid=text) for text in dict.fromkeys(texts)] for dst_lang in dst_langs}
+    logger.info(f"Prefetching {len(texts)} voiceovers in {len(dst_langs)} languages...")
+    with (
+        voiceover.Prefetcher(
+            tts_service,
+            stt_service,
+            cache_dir=cache_dir,
+            backend=backend,
+            chunk_size=chunk_size,
+            post_processing=post_processing,
+            batch_stt=batch_stt,
+        ) as prefetcher,
+        futures.ThreadPoolExecutor(max_workers=service.max_concurrency) as pool,
+    ):
+
+        def run_batch(batch: list[polib.POEntry], dst_lang: str) -> None:
+            _translate_batch(batch, src_lang, dst_lang, service, memory)
+            prefetcher.submit(entry.msgstr for entry in batch)
+
+        jobs: list[futures.Future[None]] = []
+        for dst_lang, lang_entries in entries.items():
+            if dst_lang == src_lang:
+                for entry in lang_entries:
+                    entry.msgstr = entry.msgid
+                prefetcher.submit(texts)
+                continue
+            remaining = _recall_entries(lang_entries, memory, src_lang, dst_lang, service.fingerprint)
+            prefetcher.submit(entry.msgstr for entry in lang_entries if entry.msgstr)
+            jobs.extend(
+                pool.submit(run_batch, batch, dst_lang)
+                for batch in _batch_entries(remaining, service.max_batch_size, service.max_batch_bytes)
+            )
+        for job in jobs:
+            job.result()
+
+    translations: dict[str, list[str]] = {}
+    for dst_lang, lang_entries in entries.items():
+        for entry in lang_entries:
+            _check_bookmarks(entry, dst_lang)
+        mapping = {entry.msgid: entry.msgstr for entry in lang_entries}
+        translations[dst_lang] = [mapping[text] for text in texts]
+    return translations
@@ -1,50 +1,906 @@
 """Voiceover utils for Manim Speech."""
 
+import asyncio
+import bisect
+import contextlib
+import functools
 import hashlib
+import logging
+import multiprocessing
+import os
 import re
+import threading
+import time
+import zipfile
+from collections import abc
+from concurrent import futures
 from os import PathLike
 from pathlib import Path
+from typing import Self
 
-import manim
-import numpy as np
-import slugify
-from mutagen import File
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
-from . import services
+from . import audio, backends, cache, services, telemetry
+
+# Manim's logger is looked up by name, and numpy is imported where it is used, so render workers and tools that only
+# read the cache do not load either.
+logger = logging.getLogger("manim")
+
+MIN_ALIGNMENT_SCORE = 0.8
+# Batched transcription: silence between clips (so no word spans two clips) and the longest audio per request.
+STT_BATCH_GAP = 1.0
+STT_BATCH_DURATION = 600.0
+CACHE_ONLY_ENV_VAR = "MANIM_SPEECH_CACHE_ONLY"
+BOOKMARK_PATTERN = re.compile(r"<bookmark\s*mark\s*=['\"](\w*)[\"']\s*/>")
+# Western sentence ends must be followed by whitespace (so "3.14" is not split), CJK ones need not be.
+SENTENCE_END_PATTERN = re.compile(r"[.!?]+[\"')\]”’]*(?:\s+|$)|[。！？]+[」』”’]*\s*")
 
 
 class VoiceoverData(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     path: Path
-    transcript: services.Transcript
+    transcript: services.TranscriptView
     duration: float
     bookmarks: dict[str, float]
+    alignment_score: float | None = None
+
+    def get_bookmark(self, key: str) -> float:
+        return self.bookmarks.get(key, 0.0)
 
 
 def remove_bookmarks(s: str) -> str:
-    return re.sub(r"<bookmark\s*mark\s*=['\"]\w*[\"']\s*/>", "", s)
+    return BOOKMARK_PATTERN.sub("", s)
+
+
+def _get_bookmark_offsets(text: str) -> dict[str, int]:
+    bookmark_dist: dict[str, int] = {}
+    removed = 0
+    for match in BOOKMARK_PATTERN.finditer(text):
+        bookmark_dist[match.group(1)] = match.start() - removed
+        removed += match.end() - match.start()
+    return bookmark_dist
+
 
+def _align_bookmarks(
+    text: str, transcript: services.Transcript | services.TranscriptView
+) -> tuple[dict[str, float], float | None]:
+    bookmark_dist = _get_bookmark_offsets(text)
+    if not bookmark_dist:
+        return {}, None
+    if isinstance(transcript, services.Transcript):
+        transcript = services.TranscriptView.from_transcript(transcript)
+
+    import numpy as np
+
+    from . import alignment
 
-def get_bookmark_times(text: str, transcript: services.Transcript) -> dict[str, float]:
     cleaned_text = remove_bookmarks(text)
-    ct_len = len(cleaned_text)
-    tt_len = len(transcript.text.strip())
+    offsets = np.fromiter(bookmark_dist.values(), np.int64, len(bookmark_dist))
+    with telemetry.span("alignment", words=len(transcript)):
+        result = alignment.align(cleaned_text, transcript)
+    if len(result.offsets) > 0:
+        bookmark_times = result.get_times(offsets, len(cleaned_text), float(transcript.ends[-1]))
+    else:
+        # Nothing in the transcript matches the script, so fall back to scaling by the text length.
+        bookmark_times = np.interp(
+            offsets * len(transcript.text.strip()) / len(cleaned_text),
+            np.append(transcript.text_starts, len(transcript.text)),
+            np.append(transcript.starts, transcript.ends[-1]),
+        )
+    return dict(zip(bookmark_dist, bookmark_times.tolist())), result.score
 
-    bookmark_dist: dict[str, int] = {}
-    offset = 0
-    for part in re.split(r"(<bookmark\s*mark\s*=[\'\"]\w*[\"\']\s*/>)", text):
-        match = re.match(r"<bookmark\s*mark\s*=[\'\"](.*)[\"\']\s*/>", part)
-        if match is not None:
-            bookmark_dist[match.group(1)] = offset
+
+def get_bookmark_times(text: str, transcript: services.Transcript | services.TranscriptView) -> dict[str, float]:
+    return _align_bookmarks(text, transcript)[0]
+
+
+def split_sentences(text: str, max_chars: int) -> list[str]:
+    sentences: list[str] = []
+    start = 0
+    for match in SENTENCE_END_PATTERN.finditer(text):
+        sentences.append(text[start : match.end()])
+        start = match.end()
+    sentences.append(text[start:])
+
+    chunks: list[str] = []
+    for sentence in sentences:
+        if chunks and len(chunks[-1]) + len(sentence) <= max_chars:
+            chunks[-1] += sentence
+        else:
+            chunks.append(sentence)
+    return [chunk.strip() for chunk in chunks if chunk.strip()]
+
+
+def _get_key(cleaned_text: str, tts_service: services.Service | None) -> str:
+    import slugify
+
+    fingerprint = tts_service.fingerprint if tts_service is not None else ""
+    digest = hashlib.sha256(f"{fingerprint}\n{cleaned_text}".encode()).hexdigest()
+    return f"{slugify.slugify(cleaned_text, max_length=50, word_boundary=True, save_order=True)}-{digest[:16]}"
+
+
+def _collect_pending(
+    texts: abc.Iterable[str], tts_service: services.Service | None, cache_dir: Path
+) -> dict[Path, str]:
+    pending: dict[Path, str] = {}
+    for text in texts:
+        cleaned_text = remove_bookmarks(text)
+        pending.setdefault(cache_dir / _get_key(cleaned_text, tts_service), cleaned_text)
+    return pending
+
+
+def _init_cache_entry(cleaned_text: str, cache_path: Path, tts_service: services.Service | None) -> None:
+    # Must be called with the entry lock held.
+    if cache.read_metadata(cache_path) is None:
+        cache.write_metadata(
+            cache_path,
+            cache.EntryMetadata(
+                text=cleaned_text, tts_fingerprint=tts_service.fingerprint if tts_service is not None else ""
+            ),
+        )
+
+
+def _probe_audio(path: Path) -> cache.AudioInfo:
+    with telemetry.span("audio.probe"):
+        duration, sample_rate, codec = audio.probe(path)
+    return cache.AudioInfo(duration=duration, sample_rate=sample_rate, codec=codec)
+
+
+def _record_file(
+    cache_path: Path, name: str, *, transcript_fingerprint: str | None = None, invalidate: tuple[str, ...] = ()
+) -> None:
+    # Must be called with the entry lock held.
+    metadata = cache.read_metadata(cache_path)
+    assert metadata is not None
+    metadata.files[name] = cache.get_file_record(cache_path / name)
+    if name == "audio.mp3":
+        # Probed once here, so cache hits never parse the audio again. The PCM copy is derived from the old audio.
+        metadata.audio = _probe_audio(cache_path / name)
+        metadata.files.pop("audio.wav", None)
+    for other_name in invalidate:
+        metadata.files.pop(other_name, None)
+    if transcript_fingerprint is not None:
+        metadata.stt_fingerprint = transcript_fingerprint
+    cache.write_metadata(cache_path, metadata)
+
+
+def _get_audio_info(cache_path: Path) -> cache.AudioInfo:
+    metadata = cache.read_metadata(cache_path)
+    if metadata is not None and metadata.audio is not None:
+        return metadata.audio
+    # Entries created before the audio was probed at synthesis time are updated on first use.
+    with cache.EntryLock(cache_path):
+        metadata = cache.read_metadata(cache_path)
+        assert metadata is not None
+        if metadata.audio is None:
+            metadata.audio = _probe_audio(cache_path / "audio.mp3")
+            cache.write_metadata(cache_path, metadata)
+        return metadata.audio
+
+
+def get_audio_path(cache_path: Path, audio_format: str = "mp3") -> Path:
+    if audio_format == "mp3":
+        return cache_path / "audio.mp3"
+    if audio_format != "wav":
+        raise ValueError(f'Audio format must be "mp3" or "wav", not "{audio_format}"')
+
+    # An uncompressed copy spares Manim from decoding the MP3 again in every render.
+    wav_path = cache_path / "audio.wav"
+    metadata = cache.read_metadata(cache_path)
+    if metadata is not None and "audio.wav" in metadata.files:
+        with contextlib.suppress(OSError):
+            if wav_path.stat().st_size == metadata.files["audio.wav"].size:
+                return wav_path
+    with cache.EntryLock(cache_path):
+        tmp_path = cache.get_temp_path(wav_path)
+        try:
+            with telemetry.span("audio.wav"):
+                audio.write_wav(tmp_path, *audio.read_audio(cache_path / "audio.mp3"))
+            os.replace(tmp_path, wav_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        metadata = cache.read_metadata(cache_path)
+        assert metadata is not None
+        metadata.files["audio.wav"] = cache.get_file_record(wav_path)
+        cache.write_metadata(cache_path, metadata)
+    return wav_path
+
+
+def _load_transcript(cache_path: Path, record: cache.FileRecord) -> services.TranscriptView:
+    # The binary sidecar is named after the hash of the JSON transcript, so a stale one is never loaded.
+    sidecar_path = cache_path / f"transcript-{record.sha256[:16]}.npz"
+    with contextlib.suppress(OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return services.TranscriptView.load(sidecar_path)
+
+    with (cache_path / "transcript.json").open("rb") as f:
+        transcript = services.TranscriptView.from_json(f.read())
+    for old_path in cache_path.glob("transcript-*.npz"):
+        with contextlib.suppress(OSError):
+            old_path.unlink()
+    tmp_path = cache.get_temp_path(sidecar_path)
+    try:
+        with tmp_path.open("wb") as f:
+            transcript.save(f)
+        os.replace(tmp_path, sidecar_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return transcript
+
+
+def _get_transcript_record(cache_path: Path, stt_service: services.Service | None) -> cache.FileRecord | None:
+    metadata = cache.read_metadata(cache_path)
+    if metadata is None or not cache.is_valid(cache_path, "transcript.json", metadata):
+        return None
+    # Transcripts returned by the TTS service itself are exact, so they are used regardless of the STT service.
+    if stt_service is not None and metadata.stt_fingerprint not in (stt_service.fingerprint, metadata.tts_fingerprint):
+        return None
+    return metadata.files["transcript.json"]
+
+
+def _read_transcript(cache_path: Path, stt_service: services.Service | None) -> services.TranscriptView | None:
+    record = _get_transcript_record(cache_path, stt_service)
+    if record is None:
+        return None
+    with telemetry.span("transcript.load"):
+        return _load_transcript(cache_path, record)
+
+
+def _write_transcript(cache_path: Path, transcript: services.Transcript) -> None:
+    transcript_path = cache_path / "transcript.json"
+    tmp_path = cache.get_temp_path(transcript_path)
+    try:
+        with tmp_path.open("w") as f:
+            f.write(transcript.model_dump_json(indent=4))
+        os.replace(tmp_path, transcript_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _write_tts_transcript(cache_path: Path, transcript: services.Transcript, backend: backends.CacheBackend) -> None:
+    metadata = cache.read_metadata(cache_path)
+    assert metadata is not None
+    _write_transcript(cache_path, transcript)
+    _publish(backend, cache_path.name, _get_transcript_name(metadata.tts_fingerprint), cache_path / "transcript.json")
+
+
+def _fetch_tts_transcript(cache_path: Path, backend: backends.CacheBackend) -> bool:
+    # Must be called with the entry lock held.
+    metadata = cache.read_metadata(cache_path)
+    if metadata is None or not _fetch(
+        backend, cache_path.name, _get_transcript_name(metadata.tts_fingerprint), cache_path / "transcript.json"
+    ):
+        return False
+    _record_file(cache_path, "transcript.json", transcript_fingerprint=metadata.tts_fingerprint)
+    return True
+
+
+def _get_transcript_name(fingerprint: str) -> str:
+    return f"transcript-{fingerprint[:16]}.json"
+
+
+def _fetch(backend: backends.CacheBackend, key: str, name: str, out_path: Path) -> bool:
+    provider = type(backend).__name__
+    with telemetry.span("cache.get", provider=provider) as attributes:
+        found = attributes["found"] = backend.get(key, name, out_path)
+    if found:
+        telemetry.count("cache.bytes_downloaded", out_path.stat().st_size, provider=provider)
+    return found
+
+
+def _publish(backend: backends.CacheBackend, key: str, name: str, in_path: Path) -> None:
+    with telemetry.span("cache.put", provider=type(backend).__name__):
+        backend.put(key, name, in_path)
+
+
+def _produce(
+    backend: backends.CacheBackend, cache_path: Path, name: str, out_path: Path, generate: abc.Callable[[Path], None]
+) -> None:
+    while not _fetch(backend, cache_path.name, name, out_path):
+        if backend.claim(cache_path.name, name):
+            try:
+                # Another worker may have published the file between the lookup and the claim.
+                if not _fetch(backend, cache_path.name, name, out_path):
+                    tmp_path = cache.get_temp_path(out_path)
+                    try:
+                        generate(tmp_path)
+                        os.replace(tmp_path, out_path)
+                    finally:
+                        tmp_path.unlink(missing_ok=True)
+                    _publish(backend, cache_path.name, name, out_path)
+            finally:
+                backend.release(cache_path.name, name)
+            return
+        time.sleep(backend.poll_interval)
+
+
+async def _produce_async(
+    backend: backends.CacheBackend,
+    cache_path: Path,
+    name: str,
+    out_path: Path,
+    generate: abc.Callable[[Path], abc.Awaitable[None]],
+) -> None:
+    while not await asyncio.to_thread(_fetch, backend, cache_path.name, name, out_path):
+        if await asyncio.to_thread(backend.claim, cache_path.name, name):
+            try:
+                if not await asyncio.to_thread(_fetch, backend, cache_path.name, name, out_path):
+                    tmp_path = cache.get_temp_path(out_path)
+                    try:
+                        await generate(tmp_path)
+                        os.replace(tmp_path, out_path)
+                    finally:
+                        tmp_path.unlink(missing_ok=True)
+                    await asyncio.to_thread(_publish, backend, cache_path.name, name, out_path)
+            finally:
+                await asyncio.to_thread(backend.release, cache_path.name, name)
+            return
+        await asyncio.sleep(backend.poll_interval)
+
+
+def _stream_audio(
+    cleaned_text: str,
+    out_path: Path,
+    tts_service: services.TTSService,
+    on_boundaries: abc.Callable[[list[services.Boundary]], None],
+) -> services.Transcript | None:
+    boundaries: list[services.Boundary] = []
+    with out_path.open("wb") as f:
+        for chunk in tts_service.tts_stream(cleaned_text):
+            f.write(chunk.data)
+            if chunk.boundaries:
+                boundaries.extend(chunk.boundaries)
+                on_boundaries(chunk.boundaries)
+    return services.Transcript(text=cleaned_text, boundaries=boundaries) if boundaries else None
+
+
+def _tts_span(
+    tts_service: services.Service, cleaned_text: str
+) -> contextlib.AbstractContextManager[telemetry.Attributes]:
+    telemetry.count("tts.characters", len(cleaned_text), provider=tts_service.service_name)
+    return telemetry.span("tts", provider=tts_service.service_name, characters=len(cleaned_text))
+
+
+def _stt_span(
+    stt_service: services.Service, cache_path: Path
+) -> contextlib.AbstractContextManager[telemetry.Attributes]:
+    # Must be called with the entry lock held, so the duration is read from the metadata rather than probed.
+    metadata = cache.read_metadata(cache_path)
+    if metadata is not None and metadata.audio is not None:
+        telemetry.count("stt.seconds", metadata.audio.duration, provider=stt_service.service_name)
+    return telemetry.span("stt", provider=stt_service.service_name)
+
+
+def _fetch_cached_audio(
+    cleaned_text: str, cache_path: Path, tts_service: services.TTSService, backend: backends.CacheBackend
+) -> None:
+    # The backend is checked before the entry is created, so looking up a missing clip leaves nothing behind.
+    tmp_path = cache.get_temp_path(cache_path.with_name(f"{cache_path.name}.mp3"))
+    try:
+        if not _fetch(backend, cache_path.name, "audio.mp3", tmp_path):
+            raise VoiceoverNotCachedError(f'Audio of "{cleaned_text}" is not cached')
+        cache_path.mkdir(parents=True, exist_ok=True)
+        with cache.EntryLock(cache_path):
+            _init_cache_entry(cleaned_text, cache_path, tts_service)
+            if not cache.is_valid(cache_path, "audio.mp3"):
+                os.replace(tmp_path, cache_path / "audio.mp3")
+                _record_file(cache_path, "audio.mp3", invalidate=("transcript.json",))
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _ensure_audio(
+    cleaned_text: str,
+    cache_path: Path,
+    tts_service: services.TTSService | None,
+    backend: backends.CacheBackend,
+    on_boundaries: abc.Callable[[list[services.Boundary]], None] | None = None,
+) -> bool:
+    if isinstance(tts_service, _CacheOnlyTTSService) and not cache.is_valid(cache_path, "audio.mp3"):
+        _fetch_cached_audio(cleaned_text, cache_path, tts_service, backend)
+    cache_path.mkdir(parents=True, exist_ok=True)
+    if cache.is_valid(cache_path, "audio.mp3"):
+        telemetry.count("cache.audio.hit")
+        return True
+    telemetry.count("cache.audio.miss")
+    logger.info(f'Audio file for "{cache_path.name}" not found or corrupt.')
+    if tts_service is None:
+        logger.info(f'No TTS service specified. Skipping "{cache_path.name}".')
+        return False
+
+    transcript: services.Transcript | None = None
+
+    def generate(out_path: Path) -> None:
+        nonlocal transcript
+        logger.info(f"Generating audio using {tts_service.service_name} TTS service...")
+        with _tts_span(tts_service, cleaned_text):
+            if on_boundaries is not None and tts_service.supports_streaming:
+                transcript = _stream_audio(cleaned_text, out_path, tts_service, on_boundaries)
+            else:
+                transcript = tts_service.tts(cleaned_text, out_path)
+        if transcript is not None:
+            # Published before the audio, so other workers never fall back to STT.
+            _write_tts_transcript(cache_path, transcript, backend)
+
+    with cache.EntryLock(cache_path):
+        _init_cache_entry(cleaned_text, cache_path, tts_service)
+        # Another process may have generated the audio while this one was waiting for the lock.
+        if not cache.is_valid(cache_path, "audio.mp3"):
+            _produce(backend, cache_path, "audio.mp3", cache_path / "audio.mp3", generate)
+            _record_file(cache_path, "audio.mp3", invalidate=("transcript.json",))
+            if transcript is not None:
+                _record_file(cache_path, "transcript.json", transcript_fingerprint=tts_service.fingerprint)
+    return True
+
+
+async def _ensure_audio_async(
+    cleaned_text: str,
+    cache_path: Path,
+    tts_service: services.AsyncTTSService | None,
+    backend: backends.CacheBackend,
+    semaphore: asyncio.Semaphore,
+) -> bool:
+    cache_path.mkdir(parents=True, exist_ok=True)
+    if cache.is_valid(cache_path, "audio.mp3"):
+        telemetry.count("cache.audio.hit")
+        return True
+    telemetry.count("cache.audio.miss")
+    logger.info(f'Audio file for "{cache_path.name}" not found or corrupt.')
+    if tts_service is None:
+        logger.info(f'No TTS service specified. Skipping "{cache_path.name}".')
+        return False
+
+    transcript: services.Transcript | None = None
+
+    async def generate(out_path: Path) -> None:
+        nonlocal transcript
+        logger.info(f"Generating audio using {tts_service.service_name} TTS service...")
+        async with semaphore:
+            with _tts_span(tts_service, cleaned_text):
+                transcript = await tts_service.tts(cleaned_text, out_path)
+        if transcript is not None:
+            await asyncio.to_thread(_write_tts_transcript, cache_path, transcript, backend)
+
+    lock = cache.EntryLock(cache_path)
+    await asyncio.to_thread(lock.acquire)
+    try:
+        _init_cache_entry(cleaned_text, cache_path, tts_service)
+        if not cache.is_valid(cache_path, "audio.mp3"):
+            await _produce_async(backend, cache_path, "audio.mp3", cache_path / "audio.mp3", generate)
+            _record_file(cache_path, "audio.mp3", invalidate=("transcript.json",))
+            if transcript is not None:
+                _record_file(cache_path, "transcript.json", transcript_fingerprint=tts_service.fingerprint)
+    finally:
+        lock.release()
+    return True
+
+
+def _ensure_transcript(
+    cache_path: Path, stt_service: services.STTService | None, backend: backends.CacheBackend
+) -> services.TranscriptView | None:
+    transcript = _read_transcript(cache_path, stt_service)
+    if transcript is not None:
+        telemetry.count("cache.transcript.hit")
+        return transcript
+    telemetry.count("cache.transcript.miss")
+
+    def generate(out_path: Path) -> None:
+        assert stt_service is not None
+        logger.info(f"Generating transcript using {stt_service.service_name} STT service...")
+        with _stt_span(stt_service, cache_path):
+            result = stt_service.stt(cache_path / "audio.mp3")
+        with out_path.open("w") as f:
+            f.write(result.model_dump_json(indent=4))
+
+    with cache.EntryLock(cache_path):
+        transcript = _read_transcript(cache_path, stt_service)
+        if transcript is None and not _fetch_tts_transcript(cache_path, backend):
+            logger.info(f'Transcript file for "{cache_path.name}" not found or out of date.')
+            if stt_service is None:
+                return None
+            _produce(
+                backend,
+                cache_path,
+                _get_transcript_name(stt_service.fingerprint),
+                cache_path / "transcript.json",
+                generate,
+            )
+            _record_file(cache_path, "transcript.json", transcript_fingerprint=stt_service.fingerprint)
+        if transcript is None:
+            transcript = _read_transcript(cache_path, stt_service)
+    return transcript
+
+
+async def _ensure_transcript_async(
+    cache_path: Path,
+    stt_service: services.AsyncSTTService | None,
+    backend: backends.CacheBackend,
+    semaphore: asyncio.Semaphore,
+) -> services.TranscriptView | None:
+    transcript = _read_transcript(cache_path, stt_service)
+    if transcript is not None:
+        telemetry.count("cache.transcript.hit")
+        return transcript
+    telemetry.count("cache.transcript.miss")
+
+    async def generate(out_path: Path) -> None:
+        assert stt_service is not None
+        logger.info(f"Generating transcript using {stt_service.service_name} STT service...")
+        async with semaphore:
+            with _stt_span(stt_service, cache_path):
+                result = await stt_service.stt(cache_path / "audio.mp3")
+        with out_path.open("w") as f:
+            f.write(result.model_dump_json(indent=4))
+
+    lock = cache.EntryLock(cache_path)
+    await asyncio.to_thread(lock.acquire)
+    try:
+        transcript = _read_transcript(cache_path, stt_service)
+        if transcript is None and not await asyncio.to_thread(_fetch_tts_transcript, cache_path, backend):
+            logger.info(f'Transcript file for "{cache_path.name}" not found or out of date.')
+            if stt_service is None:
+                return None
+            await _produce_async(
+                backend,
+                cache_path,
+                _get_transcript_name(stt_service.fingerprint),
+                cache_path / "transcript.json",
+                generate,
+            )
+            _record_file(cache_path, "transcript.json", transcript_fingerprint=stt_service.fingerprint)
+        if transcript is None:
+            transcript = _read_transcript(cache_path, stt_service)
+    finally:
+        lock.release()
+    return transcript
+
+
+def _empty_voiceover_data(cache_path: Path) -> VoiceoverData:
+    logger.warning(f'No audio is available for "{cache_path.name}". The voiceover will be silent.')
+    return VoiceoverData(
+        path=cache_path,
+        transcript=services.TranscriptView.from_boundaries("", []),
+        duration=1e-6,
+        bookmarks={},
+    )
+
+
+@functools.cache
+def _get_process_pool() -> futures.ProcessPoolExecutor:
+    # Shared by all voiceovers, so clips synthesized in parallel are also processed in parallel. Workers are not
+    # forked, as jobs are submitted from worker threads and a fork could copy locks held by other threads.
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return futures.ProcessPoolExecutor(mp_context=multiprocessing.get_context(method))
+
+
+def _shift_transcript(transcript: services.TranscriptView, offset: float, duration: float) -> services.TranscriptView:
+    import numpy as np
+
+    return services.TranscriptView(
+        transcript.text,
+        transcript.words,
+        np.clip(transcript.starts - offset, 0.0, duration),
+        np.clip(transcript.ends - offset, 0.0, duration),
+        transcript.text_starts,
+    )
+
+
+def _is_processed(processed_path: Path, source: cache.EntryMetadata, metadata: cache.EntryMetadata | None) -> bool:
+    return (
+        metadata is not None
+        and metadata.processing is not None
+        and metadata.processing.source.matches(source.files["audio.mp3"])
+        and cache.is_valid(processed_path, "audio.mp3", metadata)
+    )
+
+
+def _ensure_processed(
+    cache_path: Path,
+    transcript: services.TranscriptView | None,
+    stt_service: services.Service | None,
+    post_processing: audio.PostProcessing,
+    cache_only: bool = False,
+) -> tuple[Path, services.TranscriptView | None]:
+    # Processed clips are cache entries of their own, derived from the unprocessed audio and transcript.
+    source = cache.read_metadata(cache_path)
+    assert source is not None
+    processed_path = cache_path.with_name(f"{cache_path.name}-{post_processing.fingerprint[:8]}")
+    if cache_only and not _is_processed(processed_path, source, cache.read_metadata(processed_path)):
+        raise VoiceoverNotCachedError(f'Processed audio of "{cache_path.name}" is not cached')
+    processed_path.mkdir(parents=True, exist_ok=True)
+    with cache.EntryLock(processed_path):
+        metadata = cache.read_metadata(processed_path)
+        if not _is_processed(processed_path, source, metadata):
+            logger.info(f'Post-processing audio of "{cache_path.name}"...')
+            cache.write_metadata(
+                processed_path, cache.EntryMetadata(text=source.text, tts_fingerprint=source.tts_fingerprint)
+            )
+            tmp_path = cache.get_temp_path(processed_path / "audio.mp3")
+            try:
+                with telemetry.span("audio.post_process"):
+                    trim_start = (
+                        _get_process_pool()
+                        .submit(audio.post_process, cache_path / "audio.mp3", tmp_path, post_processing)
+                        .result()
+                    )
+                os.replace(tmp_path, processed_path / "audio.mp3")
+            finally:
+                tmp_path.unlink(missing_ok=True)
+            _record_file(processed_path, "audio.mp3")
+            metadata = cache.read_metadata(processed_path)
+            assert metadata is not None
+            metadata.processing = cache.ProcessingRecord(source=source.files["audio.mp3"], trim_start=trim_start)
+            metadata.sources = [cache_path.name]
+            cache.write_metadata(processed_path, metadata)
+
+        if transcript is None:
+            return processed_path, None
+        assert metadata is not None
+        processed = _read_transcript(processed_path, stt_service)
+        if processed is None or metadata.stt_fingerprint != source.stt_fingerprint:
+            # Word times are shifted by the trimmed silence, and clamped to the processed audio.
+            assert metadata.processing is not None and metadata.audio is not None
+            processed = _shift_transcript(transcript, metadata.processing.trim_start, metadata.audio.duration)
+            _write_transcript(processed_path, processed.to_transcript())
+            _record_file(processed_path, "transcript.json", transcript_fingerprint=source.stt_fingerprint)
+            processed = _read_transcript(processed_path, stt_service)
+    return processed_path, processed
+
+
+def _default_transcript(cleaned_text: str, duration: float) -> services.TranscriptView:
+    return services.TranscriptView.from_boundaries(
+        cleaned_text, [services.Boundary(text=cleaned_text, start=0.0, end=duration, text_start=0)]
+    )
+
+
+def _get_sources(cache_path: Path) -> list[str]:
+    metadata = cache.read_metadata(cache_path)
+    if metadata is None:
+        return []
+    return [key for source in metadata.sources for key in (source, *_get_sources(cache_path.parent / source))]
+
+
+def _load_voiceover_data(text: str, cache_path: Path, transcript: services.TranscriptView | None) -> VoiceoverData:
+    cleaned_text = remove_bookmarks(text)
+    duration = _get_audio_info(cache_path).duration
+    if transcript is None:
+        logger.info(f'No STT service specified and no TTS timestamps. Using default method for "{cache_path.name}".')
+        transcript = _default_transcript(cleaned_text, duration)
+
+    bookmarks, alignment_score = _align_bookmarks(text, transcript)
+    if alignment_score is not None and alignment_score < MIN_ALIGNMENT_SCORE:
+        logger.warning(
+            f'Only {alignment_score:.0%} of the words of "{cache_path.name}" were found in its transcript. '
+            "Bookmark locations may be inaccurate."
+        )
+
+    # Sources are touched too, so pruning does not evict them before the clips derived from them.
+    index = cache.CacheIndex(cache_path.parent)
+    for key in (cache_path.name, *_get_sources(cache_path)):
+        index.touch(key)
+    return VoiceoverData(
+        path=cache_path,
+        transcript=transcript,
+        duration=duration,
+        bookmarks=bookmarks,
+        alignment_score=alignment_score,
+    )
+
+
+class StreamingVoiceover:
+    def __init__(self, text: str, path: Path) -> None:
+        self.text = text
+        self.path = path
+        self.future: futures.Future[VoiceoverData] = futures.Future()
+        self.boundaries: list[services.Boundary] = []
+        self.bookmark_offsets = _get_bookmark_offsets(text)
+        self.condition = threading.Condition()
+        self.future.add_done_callback(lambda _: self._notify())
+
+    def _notify(self) -> None:
+        with self.condition:
+            self.condition.notify_all()
+
+    def add_boundaries(self, boundaries: list[services.Boundary]) -> None:
+        with self.condition:
+            self.boundaries.extend(boundaries)
+            self.condition.notify_all()
+
+    def result(self, timeout: float | None = None) -> VoiceoverData:
+        return self.future.result(timeout)
+
+    @property
+    def transcript(self) -> services.TranscriptView:
+        return self.result().transcript
+
+    @property
+    def duration(self) -> float:
+        return self.result().duration
+
+    @property
+    def bookmarks(self) -> dict[str, float]:
+        return self.result().bookmarks
+
+    def get_bookmark(self, key: str) -> float:
+        if key not in self.bookmark_offsets:
+            return 0.0
+        offset = self.bookmark_offsets[key]
+        with self.condition:
+            # A bookmark is final once the stream has aligned a word past it.
+            self.condition.wait_for(
+                lambda: self.future.done() or (bool(self.boundaries) and self.boundaries[-1].text_start >= offset)
+            )
+            if not self.future.done():
+                transcript = services.Transcript(text=remove_bookmarks(self.text), boundaries=list(self.boundaries))
+                return get_bookmark_times(self.text, transcript)[key]
+        return self.result().get_bookmark(key)
+
+
+def _merge_transcripts(
+    chunks: list[str], transcripts: list[services.TranscriptView | None], durations: list[float]
+) -> services.TranscriptView:
+    import numpy as np
+
+    parts: list[services.TranscriptView] = []
+    for chunk_text, transcript, duration in zip(chunks, transcripts, durations):
+        if transcript is None:
+            transcript = _default_transcript(chunk_text, duration)
+        parts.append(transcript)
+
+    time_offsets = np.cumsum([0.0, *durations[:-1]])
+    text_offsets = np.cumsum([0, *(len(part.text) + 1 for part in parts[:-1])])
+    return services.TranscriptView(
+        " ".join(part.text for part in parts),
+        np.concatenate([part.words for part in parts]),
+        np.concatenate([part.starts + offset for part, offset in zip(parts, time_offsets)]),
+        np.concatenate([part.ends + offset for part, offset in zip(parts, time_offsets)]),
+        np.concatenate([part.text_starts + offset for part, offset in zip(parts, text_offsets)]),
+    )
+
+
+def _get_chunks(cleaned_text: str, tts_service: services.TTSService | None, chunk_size: int | None) -> list[str]:
+    if tts_service is None or chunk_size is None or len(cleaned_text) <= chunk_size:
+        return []
+    return split_sentences(cleaned_text, chunk_size)
+
+
+def _create_chunked(
+    cleaned_text: str,
+    chunks: list[str],
+    cache_path: Path,
+    tts_service: services.TTSService,
+    stt_service: services.STTService | None,
+    backend: backends.CacheBackend,
+) -> services.TranscriptView:
+    if cache.is_valid(cache_path, "audio.mp3"):
+        transcript = _read_transcript(cache_path, stt_service)
+        if transcript is not None:
+            return transcript
+
+    def run_chunk(chunk_text: str) -> tuple[Path, services.TranscriptView | None, str | None]:
+        # Chunks are ordinary cache entries, so editing one sentence only regenerates its chunk.
+        chunk_path = cache_path.parent / _get_key(chunk_text, tts_service)
+        _ensure_audio(chunk_text, chunk_path, tts_service, backend)
+        transcript = _ensure_transcript(chunk_path, stt_service, backend)
+        metadata = cache.read_metadata(chunk_path)
+        return chunk_path, transcript, metadata.stt_fingerprint if transcript is not None and metadata else None
+
+    logger.info(f"Generating {len(chunks)} chunks for {cache_path.name}...")
+    with futures.ThreadPoolExecutor(max_workers=tts_service.max_concurrency) as pool:
+        results = list(pool.map(run_chunk, chunks))
+
+    cache_path.mkdir(parents=True, exist_ok=True)
+    with cache.EntryLock(cache_path):
+        _init_cache_entry(cleaned_text, cache_path, tts_service)
+        tmp_path = cache.get_temp_path(cache_path / "audio.mp3")
+        try:
+            with telemetry.span("audio.concatenate", chunks=len(results)):
+                durations = audio.concatenate([chunk_path / "audio.mp3" for chunk_path, _, _ in results], tmp_path)
+            os.replace(tmp_path, cache_path / "audio.mp3")
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        _record_file(cache_path, "audio.mp3", invalidate=("transcript.json",))
+
+        transcript = _merge_transcripts(chunks, [transcript for _, transcript, _ in results], durations)
+        fingerprints = {fingerprint for _, _, fingerprint in results}
+        if fingerprints == {tts_service.fingerprint}:
+            fingerprint = tts_service.fingerprint
+        elif stt_service is not None and fingerprints <= {tts_service.fingerprint, stt_service.fingerprint}:
+            fingerprint = stt_service.fingerprint
         else:
-            offset += len(part)
+            # Some chunks have no word timings, so the merged transcript is replaced once an STT service is set.
+            fingerprint = ""
+        _write_transcript(cache_path, transcript.to_transcript())
+        _record_file(cache_path, "transcript.json", transcript_fingerprint=fingerprint)
+        # Chunks are touched along with the merged clip, so they outlive it in the cache for the next edit.
+        metadata = cache.read_metadata(cache_path)
+        assert metadata is not None
+        metadata.sources = list(dict.fromkeys(chunk_path.name for chunk_path, _, _ in results))
+        cache.write_metadata(cache_path, metadata)
+    return transcript
+
+
+def _create(
+    text: str,
+    tts_service: services.TTSService | None,
+    stt_service: services.STTService | None,
+    cache_dir: str | PathLike[str] | None,
+    backend: backends.CacheBackend | None,
+    on_boundaries: abc.Callable[[list[services.Boundary]], None] | None = None,
+    chunk_size: int | None = None,
+    post_processing: audio.PostProcessing | None = None,
+) -> VoiceoverData:
+    cache_dir = cache.get_cache_dir(cache_dir)
+    if backend is None:
+        backend = backends.LocalCacheBackend()
 
-    bookmark_times = np.interp(
-        np.array([v for k, v in bookmark_dist.items()]) * tt_len / ct_len,
-        [b.text_start for b in transcript.boundaries] + [len(transcript.text)],
-        [b.start for b in transcript.boundaries] + [transcript.boundaries[-1].end],
+    cleaned_text = remove_bookmarks(text)
+    key = _get_key(cleaned_text, tts_service)
+    cache_path = cache_dir / key
+
+    logger.info(
+        f'Processing voiceover "{f"{cleaned_text[:50]}..." if len(cleaned_text) > 50 else cleaned_text}" stored at {key}...'
     )
-    return {name: t for name, t in zip(bookmark_dist.keys(), bookmark_times)}
+
+    chunks = _get_chunks(cleaned_text, tts_service, chunk_size)
+    transcript: services.TranscriptView | None
+    if len(chunks) > 1:
+        assert tts_service is not None
+        transcript = _create_chunked(cleaned_text, chunks, cache_path, tts_service, stt_service, backend)
+    elif _ensure_audio(cleaned_text, cache_path, tts_service, backend, on_boundaries):
+        transcript = _ensure_transcript(cache_path, stt_service, backend)
+    else:
+        return _empty_voiceover_data(cache_path)
+
+    if post_processing is not None:
+        cache_path, transcript = _ensure_processed(
+            cache_path, transcript, stt_service, post_processing, isinstance(tts_service, _CacheOnlyTTSService)
+        )
+    return _load_voiceover_data(text, cache_path, transcript)
+
+
+class VoiceoverNotCachedError(RuntimeError):
+    pass
+
+
+class _CacheOnlyTTSService(services.TTSService):
+    # Keeps the fingerprint of the wrapped service (or of no service), so cache entries are found, but refuses to
+    # generate anything.
+    def __init__(self, service: services.TTSService | None) -> None:
+        self.service = service
+
+    @property
+    def service_name(self) -> str:
+        return self.service.service_name if self.service is not None else "Cache-only"
+
+    @property
+    def fingerprint(self) -> str:
+        return self.service.fingerprint if self.service is not None else ""
+
+    def tts(self, text: str, out_path: str | PathLike[str]) -> services.Transcript | None:
+        raise VoiceoverNotCachedError(f'Audio of "{text}" is not cached')
+
+
+class _CacheOnlySTTService(services.STTService):
+    def __init__(self, service: services.STTService) -> None:
+        self.service = service
+
+    @property
+    def service_name(self) -> str:
+        return self.service.service_name
+
+    @property
+    def fingerprint(self) -> str:
+        return self.service.fingerprint
+
+    def stt(self, in_path: str | PathLike[str]) -> services.Transcript:
+        raise VoiceoverNotCachedError(f'Transcript of "{Path(in_path).parent.name}" is not cached')
+
+
+def _get_cache_only_services(
+    tts_service: services.TTSService | None, stt_service: services.STTService | None
+) -> tuple[services.TTSService, services.STTService | None]:
+    return _CacheOnlyTTSService(tts_service), _CacheOnlySTTService(stt_service) if stt_service is not None else None
 
 
 def create(
@@ -53,68 +909,506 @@ def create(
     stt_service: services.STTService | None = None,
     *,
     cache_dir: str | PathLike[str] | None = None,
+    backend: backends.CacheBackend | None = None,
+    chunk_size: int | None = None,
+    cache_only: bool = False,
+    post_processing: audio.PostProcessing | None = None,
 ) -> VoiceoverData:
-    if cache_dir is None:
-        cache_dir = Path(manim.config.media_dir) / "manim_speech"
-    elif not isinstance(cache_dir, Path):
-        cache_dir = Path(cache_dir)
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    if cache_only:
+        # Cached clips are still fetched from the backend, but a missing one raises instead of being generated.
+        tts_service, stt_service = _get_cache_only_services(tts_service, stt_service)
+    with telemetry.span("voiceover"):
+        return _create(
+            text, tts_service, stt_service, cache_dir, backend, chunk_size=chunk_size, post_processing=post_processing
+        )
 
-    cleaned_text = remove_bookmarks(text)
-    slug = f"{slugify.slugify(cleaned_text, max_length=50, word_boundary=True, save_order=True)}-{hashlib.sha256(cleaned_text.encode()).hexdigest()[:8]}"
-    cache_path = cache_dir / slug
-    if not cache_path.exists():
-        cache_path.mkdir(parents=True)
-        with (cache_path / "text.txt").open("w") as f:
-            f.write(cleaned_text)
-
-    manim.logger.info(
-        f'Processing voiceover "{f"{cleaned_text[:50]}..." if len(cleaned_text) > 50 else cleaned_text}" stored at {slug}...'
-    )
 
-    audio_path = cache_path / "audio.mp3"
-    if not audio_path.exists():
-        manim.logger.info(f'Audio file for "{slug}" not found.')
-        if tts_service is not None:
-            manim.logger.info(f"Generating audio using {tts_service.service_name} TTS service...")
-            tts_service.tts(cleaned_text, audio_path)
-        else:
-            manim.logger.info(f'No TTS service specified. Skipping "{slug}".')
-            return VoiceoverData(
-                path=cache_path,
-                transcript=services.Transcript(text="", boundaries=[]),
-                duration=1e-6,
-                bookmarks={},
+def find_missing(
+    texts: abc.Iterable[str],
+    tts_service: services.TTSService | None = None,
+    stt_service: services.STTService | None = None,
+    *,
+    cache_dir: str | PathLike[str] | None = None,
+    backend: backends.CacheBackend | None = None,
+    chunk_size: int | None = None,
+    post_processing: audio.PostProcessing | None = None,
+) -> list[str]:
+    def is_cached(text: str) -> bool:
+        try:
+            create(
+                text,
+                tts_service,
+                stt_service,
+                cache_dir=cache_dir,
+                backend=backend,
+                chunk_size=chunk_size,
+                cache_only=True,
+                post_processing=post_processing,
             )
+        except VoiceoverNotCachedError:
+            return False
+        return True
 
-    transcript_path = cache_path / "transcript.json"
-    if transcript_path.exists():
-        with transcript_path.open() as f:
-            transcript = services.Transcript.model_validate_json(f.read())
-    else:
-        manim.logger.info(f'Transcript file for "{slug}" not found.')
-        if stt_service is not None:
-            manim.logger.info(f"Generating transcript using {stt_service.service_name} STT service...")
-            transcript = stt_service.stt(audio_path)
-            with transcript_path.open("w") as f:
-                f.write(transcript.model_dump_json(indent=4))
-        else:
-            manim.logger.info(f'No STT service specified. Using default method for "{slug}".')
-            transcript = services.Transcript(
-                text=cleaned_text,
+    texts = list(dict.fromkeys(texts))
+    with futures.ThreadPoolExecutor() as pool:
+        return [text for text, cached in zip(texts, pool.map(is_cached, texts)) if not cached]
+
+
+def create_streaming(
+    text: str,
+    tts_service: services.TTSService | None = None,
+    stt_service: services.STTService | None = None,
+    *,
+    cache_dir: str | PathLike[str] | None = None,
+    backend: backends.CacheBackend | None = None,
+    chunk_size: int | None = None,
+) -> StreamingVoiceover:
+    cache_dir = cache.get_cache_dir(cache_dir)
+    stream = StreamingVoiceover(text, cache_dir / _get_key(remove_bookmarks(text), tts_service))
+
+    def run() -> None:
+        if not stream.future.set_running_or_notify_cancel():
+            return
+        try:
+            stream.future.set_result(
+                _create(
+                    text,
+                    tts_service,
+                    stt_service,
+                    cache_dir,
+                    backend,
+                    on_boundaries=stream.add_boundaries,
+                    chunk_size=chunk_size,
+                )
+            )
+        except Exception as e:  # noqa: BLE001 - re-raised by `StreamingVoiceover.result`
+            stream.future.set_exception(e)
+
+    threading.Thread(target=run, name=f"voiceover-{stream.path.name}", daemon=True).start()
+    return stream
+
+
+class ManifestEntry(BaseModel):
+    text: str
+    tts_fingerprint: str
+    stt_fingerprint: str
+    key: str
+    audio_size: int
+    duration: float
+    bookmarks: dict[str, float]
+    alignment_score: float | None = None
+    transcript: cache.FileRecord | None = None
+    processing_fingerprint: str = ""
+    sources: list[str] = []
+
+
+class ManifestData(BaseModel):
+    entries: list[ManifestEntry] = []
+
+
+class Manifest:
+    # Records the voiceovers used by a scene with their durations and bookmarks, so a render whose clips are all cached
+    # does not decode, hash or align any audio.
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: dict[tuple[str, str, str, str], ManifestEntry] = {}
+        self.used: dict[tuple[str, str, str, str], ManifestEntry] = {}
+        with contextlib.suppress(OSError, ValueError):
+            data = ManifestData.model_validate_json(path.read_bytes())
+            self.entries = {
+                (entry.text, entry.tts_fingerprint, entry.stt_fingerprint, entry.processing_fingerprint): entry
+                for entry in data.entries
+            }
+        self.saved = dict(self.entries)
+
+    @classmethod
+    def for_scene(
+        cls, scene_name: str, cache_dir: str | PathLike[str] | None = None, language: str | None = None
+    ) -> Self:
+        # Stored as a file next to the cache entries, which are all directories. Renders of a scene in different
+        # languages share the cache, so each language has its own manifest.
+        import slugify
+
+        name = slugify.slugify(scene_name if language is None else f"{scene_name}-{language}")
+        return cls(cache.get_cache_dir(cache_dir) / f"manifest-{name}.json")
+
+    @staticmethod
+    def _get_key(
+        text: str,
+        tts_service: services.Service | None,
+        stt_service: services.Service | None,
+        post_processing: audio.PostProcessing | None,
+    ) -> tuple[str, str, str, str]:
+        return (
+            text,
+            tts_service.fingerprint if tts_service is not None else "",
+            stt_service.fingerprint if stt_service is not None else "",
+            post_processing.fingerprint if post_processing is not None else "",
+        )
+
+    def _is_present(self, entry: ManifestEntry) -> bool:
+        try:
+            return (self.path.parent / entry.key / "audio.mp3").stat().st_size == entry.audio_size
+        except OSError:
+            return False
+
+    def get(
+        self,
+        text: str,
+        tts_service: services.Service | None,
+        stt_service: services.Service | None,
+        post_processing: audio.PostProcessing | None = None,
+    ) -> VoiceoverData | None:
+        key = self._get_key(text, tts_service, stt_service, post_processing)
+        entry = self.entries.get(key)
+        if entry is None or not self._is_present(entry):
+            return None
+        cache_path = self.path.parent / entry.key
+        try:
+            with telemetry.span("transcript.load"):
+                transcript = (
+                    _load_transcript(cache_path, entry.transcript)
+                    if entry.transcript is not None
+                    else _default_transcript(remove_bookmarks(text), entry.duration)
+                )
+        except (OSError, ValueError):
+            return None
+        telemetry.count("cache.manifest.hit")
+        self.used[key] = entry
+        return VoiceoverData(
+            path=cache_path,
+            transcript=transcript,
+            duration=entry.duration,
+            bookmarks=entry.bookmarks,
+            alignment_score=entry.alignment_score,
+        )
+
+    def add(
+        self,
+        text: str,
+        tts_service: services.Service | None,
+        stt_service: services.Service | None,
+        data: VoiceoverData,
+        post_processing: audio.PostProcessing | None = None,
+    ) -> None:
+        metadata = cache.read_metadata(data.path)
+        if metadata is None or "audio.mp3" not in metadata.files:
+            return
+        key = self._get_key(text, tts_service, stt_service, post_processing)
+        self.entries[key] = self.used[key] = ManifestEntry(
+            text=key[0],
+            tts_fingerprint=key[1],
+            stt_fingerprint=key[2],
+            key=data.path.name,
+            audio_size=metadata.files["audio.mp3"].size,
+            duration=data.duration,
+            bookmarks=data.bookmarks,
+            alignment_score=data.alignment_score,
+            transcript=_get_transcript_record(data.path, stt_service),
+            processing_fingerprint=key[3],
+            sources=_get_sources(data.path),
+        )
+
+    def missing(self) -> list[ManifestEntry]:
+        return [entry for entry in self.entries.values() if not self._is_present(entry)]
+
+    def save(self) -> None:
+        # Only the voiceovers used by this render are kept, so clips removed from the scene drop out of the manifest.
+        if not self.used:
+            return
+        cache.CacheIndex(self.path.parent).touch_many(
+            key for entry in self.used.values() for key in (entry.key, *entry.sources)
+        )
+        if self.used == self.saved:
+            return
+        tmp_path = cache.get_temp_path(self.path)
+        try:
+            with tmp_path.open("w") as f:
+                f.write(ManifestData(entries=list(self.used.values())).model_dump_json(indent=4))
+            os.replace(tmp_path, self.path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        self.saved = dict(self.used)
+
+
+def _split_transcript(
+    transcript: services.Transcript, offsets: list[float], durations: list[float], gap: float
+) -> list[services.Transcript]:
+    # Each word goes to the clip its midpoint falls in, counting half of the silence on either side of the clip.
+    ends = [offset + duration + gap / 2 for offset, duration in zip(offsets, durations)]
+    clip_boundaries: list[list[services.Boundary]] = [[] for _ in offsets]
+    for boundary in transcript.boundaries:
+        clip_boundaries[min(bisect.bisect_right(ends, (boundary.start + boundary.end) / 2), len(ends) - 1)].append(
+            boundary
+        )
+
+    transcripts: list[services.Transcript] = []
+    for offset, duration, boundaries in zip(offsets, durations, clip_boundaries):
+        if not boundaries:
+            transcripts.append(services.Transcript(text="", boundaries=[]))
+            continue
+        text_start = boundaries[0].text_start
+        transcripts.append(
+            services.Transcript(
+                text=transcript.text[text_start : boundaries[-1].text_end],
                 boundaries=[
                     services.Boundary(
-                        text=cleaned_text,
-                        start=0.0,
-                        end=File(audio_path).info.length,
-                        text_start=0,
+                        text=boundary.text,
+                        start=min(max(boundary.start - offset, 0.0), duration),
+                        end=min(max(boundary.end - offset, 0.0), duration),
+                        text_start=boundary.text_start - text_start,
                     )
+                    for boundary in boundaries
                 ],
             )
+        )
+    return transcripts
 
-    return VoiceoverData(
-        path=cache_path,
-        transcript=transcript,
-        duration=File(audio_path).info.length,
-        bookmarks=get_bookmark_times(text, transcript),
-    )
+
+def _batch_by_duration(cache_paths: list[Path], max_duration: float) -> abc.Iterator[list[Path]]:
+    batch: list[Path] = []
+    duration = 0.0
+    for cache_path in cache_paths:
+        clip_duration = _get_audio_info(cache_path).duration + STT_BATCH_GAP
+        if batch and duration + clip_duration > max_duration:
+            yield batch
+            batch, duration = [], 0.0
+        batch.append(cache_path)
+        duration += clip_duration
+    if batch:
+        yield batch
+
+
+def _transcribe_batch(
+    cache_paths: list[Path], stt_service: services.STTService, backend: backends.CacheBackend, gap: float
+) -> None:
+    sources = [cache.get_file_record(cache_path / "audio.mp3") for cache_path in cache_paths]
+    tmp_path = cache.get_temp_path(cache_paths[0].parent / "stt-batch.mp3")
+    try:
+        with telemetry.span("audio.concatenate", chunks=len(cache_paths)):
+            durations = audio.concatenate([cache_path / "audio.mp3" for cache_path in cache_paths], tmp_path, gap)
+        logger.info(
+            f"Transcribing {len(cache_paths)} voiceovers in one request using {stt_service.service_name} STT service..."
+        )
+        telemetry.count("stt.seconds", sum(durations) + gap * (len(durations) - 1), provider=stt_service.service_name)
+        with telemetry.span("stt", provider=stt_service.service_name, clips=len(cache_paths)):
+            transcript = stt_service.stt(tmp_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    offsets = [sum(durations[:i]) + gap * i for i in range(len(durations))]
+    for cache_path, source, clip_transcript in zip(
+        cache_paths, sources, _split_transcript(transcript, offsets, durations, gap)
+    ):
+        if not clip_transcript.boundaries:
+            # Left to be transcribed on its own, in case the words were lost in the batch.
+            logger.warning(f'No words of "{cache_path.name}" were found in the batched transcript.')
+            continue
+        with cache.EntryLock(cache_path):
+            metadata = cache.read_metadata(cache_path)
+            # The audio may have been regenerated by another process in the meantime.
+            if metadata is None or "audio.mp3" not in metadata.files or not metadata.files["audio.mp3"].matches(source):
+                continue
+            _write_transcript(cache_path, clip_transcript)
+            _record_file(cache_path, "transcript.json", transcript_fingerprint=stt_service.fingerprint)
+        _publish(
+            backend, cache_path.name, _get_transcript_name(stt_service.fingerprint), cache_path / "transcript.json"
+        )
+
+
+def transcribe_batch(
+    cache_paths: abc.Iterable[Path],
+    stt_service: services.STTService,
+    backend: backends.CacheBackend | None = None,
+    *,
+    gap: float = STT_BATCH_GAP,
+    max_duration: float = STT_BATCH_DURATION,
+) -> int:
+    # Transcribes the clips of many cache entries in as few STT requests as possible, by concatenating them with
+    # silence in between and splitting the transcript back at the silences. Returns the number of clips transcribed.
+    if backend is None:
+        backend = backends.LocalCacheBackend()
+    pending: list[Path] = []
+    for cache_path in dict.fromkeys(cache_paths):
+        if not cache.is_valid(cache_path, "audio.mp3") or _read_transcript(cache_path, stt_service) is not None:
+            continue
+        with cache.EntryLock(cache_path):
+            if _read_transcript(cache_path, stt_service) is not None or _fetch_tts_transcript(cache_path, backend):
+                continue
+            if _fetch(
+                backend, cache_path.name, _get_transcript_name(stt_service.fingerprint), cache_path / "transcript.json"
+            ):
+                _record_file(cache_path, "transcript.json", transcript_fingerprint=stt_service.fingerprint)
+                continue
+        pending.append(cache_path)
+
+    for batch in _batch_by_duration(pending, max_duration):
+        _transcribe_batch(batch, stt_service, backend, gap)
+    return len(pending)
+
+
+class Prefetcher:
+    # Voiceovers can be submitted while earlier ones are still being synthesized, so callers producing texts
+    # incrementally (e.g. a translation pipeline) overlap with synthesis and transcription.
+    def __init__(
+        self,
+        tts_service: services.TTSService,
+        stt_service: services.STTService | None = None,
+        *,
+        cache_dir: str | PathLike[str] | None = None,
+        backend: backends.CacheBackend | None = None,
+        chunk_size: int | None = None,
+        post_processing: audio.PostProcessing | None = None,
+        batch_stt: bool = False,
+    ) -> None:
+        self.tts_service = tts_service
+        self.stt_service = stt_service
+        self.cache_dir = cache.get_cache_dir(cache_dir)
+        self.backend = backend if backend is not None else backends.LocalCacheBackend()
+        self.chunk_size = chunk_size
+        self.post_processing = post_processing
+        # Clips are then transcribed together with `transcribe_batch` once all of them have been synthesized.
+        self.batch_stt = batch_stt and stt_service is not None
+        self.tts_pool = futures.ThreadPoolExecutor(max_workers=tts_service.max_concurrency)
+        self.stt_pool = (
+            futures.ThreadPoolExecutor(max_workers=stt_service.max_concurrency if stt_service is not None else None)
+            if stt_service is not None or post_processing is not None
+            else None
+        )
+        self.submitted: set[Path] = set()
+        self.jobs: list[futures.Future[futures.Future[services.TranscriptView | None] | None]] = []
+        self.batched: list[Path] = []
+        self.lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args) -> None:
+        try:
+            if exc_type is None:
+                self.wait()
+        finally:
+            self.tts_pool.shutdown(cancel_futures=True)
+            if self.stt_pool is not None:
+                self.stt_pool.shutdown(cancel_futures=True)
+
+    def _finish_clip(self, cache_path: Path) -> services.TranscriptView | None:
+        transcript = _ensure_transcript(cache_path, self.stt_service, self.backend)
+        if self.post_processing is not None:
+            _, transcript = _ensure_processed(cache_path, transcript, self.stt_service, self.post_processing)
+        return transcript
+
+    def _run_chunked(self, cleaned_text: str, chunks: list[str], cache_path: Path) -> None:
+        transcript = _create_chunked(cleaned_text, chunks, cache_path, self.tts_service, self.stt_service, self.backend)
+        if self.post_processing is not None:
+            _ensure_processed(cache_path, transcript, self.stt_service, self.post_processing)
+
+    def _run_clip(self, cleaned_text: str, cache_path: Path) -> futures.Future[services.TranscriptView | None] | None:
+        chunks = _get_chunks(cleaned_text, self.tts_service, self.chunk_size)
+        if len(chunks) > 1:
+            # Long voiceovers are stored as chunks merged into one clip, matching what the scene will look up.
+            self._run_chunked(cleaned_text, chunks, cache_path)
+            return None
+        if not _ensure_audio(cleaned_text, cache_path, self.tts_service, self.backend) or self.stt_pool is None:
+            return None
+        if self.batch_stt:
+            with self.lock:
+                self.batched.append(cache_path)
+            return None
+        return self.stt_pool.submit(self._finish_clip, cache_path)
+
+    def _transcribe_batched(self) -> list[futures.Future[services.TranscriptView | None]]:
+        with self.lock:
+            cache_paths, self.batched = self.batched, []
+        if not cache_paths or self.stt_pool is None or self.stt_service is None:
+            return []
+        transcribe_batch(cache_paths, self.stt_service, self.backend)
+        # Clips missing from the batched transcripts are transcribed on their own here.
+        return [self.stt_pool.submit(self._finish_clip, cache_path) for cache_path in cache_paths]
+
+    def submit(self, texts: abc.Iterable[str]) -> int:
+        pending = _collect_pending(texts, self.tts_service, self.cache_dir)
+        with self.lock:
+            pending = {cache_path: text for cache_path, text in pending.items() if cache_path not in self.submitted}
+            self.submitted.update(pending)
+            self.jobs.extend(
+                self.tts_pool.submit(self._run_clip, cleaned_text, cache_path)
+                for cache_path, cleaned_text in pending.items()
+            )
+        return len(pending)
+
+    def wait(self) -> None:
+        done = 0
+        while True:
+            with self.lock:
+                tts_jobs = self.jobs[done:]
+            if not tts_jobs:
+                stt_jobs = self._transcribe_batched()
+                if not stt_jobs:
+                    return
+            else:
+                done += len(tts_jobs)
+                stt_jobs = [job for job in (tts_job.result() for tts_job in tts_jobs) if job is not None]
+            for stt_job in stt_jobs:
+                stt_job.result()
+
+
+def prefetch(
+    texts: abc.Iterable[str],
+    tts_service: services.TTSService | None = None,
+    stt_service: services.STTService | None = None,
+    *,
+    cache_dir: str | PathLike[str] | None = None,
+    backend: backends.CacheBackend | None = None,
+    chunk_size: int | None = None,
+    post_processing: audio.PostProcessing | None = None,
+    batch_stt: bool = False,
+) -> None:
+    if tts_service is None:
+        return
+
+    with Prefetcher(
+        tts_service,
+        stt_service,
+        cache_dir=cache_dir,
+        backend=backend,
+        chunk_size=chunk_size,
+        post_processing=post_processing,
+        batch_stt=batch_stt,
+    ) as prefetcher:
+        count = prefetcher.submit(texts)
+        if count:
+            logger.info(f"Prefetching {count} voiceovers...")
+
+
+async def create_many_async(
+    texts: abc.Sequence[str],
+    tts_service: services.AsyncTTSService | None = None,
+    stt_service: services.AsyncSTTService | None = None,
+    *,
+    cache_dir: str | PathLike[str] | None = None,
+    backend: backends.CacheBackend | None = None,
+) -> list[VoiceoverData]:
+    cache_dir = cache.get_cache_dir(cache_dir)
+    if backend is None:
+        backend = backends.LocalCacheBackend()
+
+    pending = _collect_pending(texts, tts_service, cache_dir)
+    tts_semaphore = asyncio.Semaphore(tts_service.max_concurrency if tts_service is not None else 1)
+    stt_semaphore = asyncio.Semaphore(stt_service.max_concurrency if stt_service is not None else 1)
+    transcripts: dict[Path, services.TranscriptView | None] = {}
+
+    async def run_clip(cleaned_text: str, cache_path: Path) -> None:
+        if await _ensure_audio_async(cleaned_text, cache_path, tts_service, backend, tts_semaphore):
+            transcripts[cache_path] = await _ensure_transcript_async(cache_path, stt_service, backend, stt_semaphore)
+
+    await asyncio.gather(*(run_clip(cleaned_text, cache_path) for cache_path, cleaned_text in pending.items()))
+
+    results: list[VoiceoverData] = []
+    for text in texts:
+        cache_path = cache_dir / _get_key(remove_bookmarks(text), tts_service)
+        if cache_path in transcripts:
+            results.append(_load_voiceover_data(text, cache_path, transcripts[cache_path]))
+        else:
+            results.append(_empty_voiceover_data(cache_path))
+    return results